@@ -0,0 +1,5 @@
+class ResourceNotFound(Exception):
+    """Raised when a tagged AWS resource cannot be found."""
+
+class AWSOpError(Exception):
+    """Raised when an AWS API operation fails."""
@@ -1,13 +1,256 @@
-import boto3
+from __future__ import annotations
+
 from botocore.exceptions import ClientError
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+
+from errors import ResourceNotFound, AWSOpError
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+import functools
 import json
+import os
+import time
+from pathlib import Path
+
+if TYPE_CHECKING:
+    import boto3
+
+# Path to config.json resolved next to this module, so imports do not depend on the CWD
+_CONFIG_PATH = Path(__file__).with_name('config.json')
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Dict[str, Any]:
+    """
+    Load configuration from config.json once and cache the parsed result.
+
+    Returns:
+        Dict[str, Any]: The parsed configuration dictionary.
+    """
+    with _CONFIG_PATH.open('r') as config_file:
+        return json.load(config_file)
+
+# Load configuration from config.json (cached)
+config = _load_config()
+
+# Configuration values frozen at import time to avoid repeated dict lookups in hot paths
+_TAG_VPC_NAME = config['TAG_VPC_NAME']
+_TAG_ENV = config['TAG_ENV']
+_TAG_IGW_NAME = config['TAG_IGW_NAME']
+
+# Request literals that never change between calls, built once at import time
+_IGW_TAG_SPECIFICATIONS = [
+    {
+        'ResourceType': 'internet-gateway',
+        'Tags': [
+            {'Key': 'Name', 'Value': _TAG_IGW_NAME},
+            {'Key': 'Environment', 'Value': _TAG_ENV}
+        ]
+    }
+]
+
+@functools.lru_cache(maxsize=None)
+def get_ec2_client(region_name: Optional[str] = None) -> boto3.client:
+    """
+    Return a shared EC2 client with a tuned connection pool.
+
+    The client is memoized per region so every caller reuses one TCP/TLS
+    session pool instead of paying client construction and handshake costs
+    per operation.
+
+    Args:
+        region_name (Optional[str]): The AWS region for the client, or None for the default.
+
+    Returns:
+        boto3.client: The shared EC2 client.
+    """
+    # Imported here so modules that only need config or pure helpers do not
+    # pay boto3's import cost; the lru_cache makes this a one-time hit
+    import boto3
+    from botocore.config import Config
+
+    # Outside EC2 the instance-metadata probe adds about a second of startup
+    # latency before timing out; skip it unless the caller opted in
+    os.environ.setdefault('AWS_EC2_METADATA_DISABLED', 'true')
+
+    return boto3.client(
+        'ec2',
+        region_name=region_name,
+        config=Config(
+            max_pool_connections=25,  # Allow concurrent helpers to reuse pooled connections
+            tcp_keepalive=True,  # Keep TLS sessions alive across waiter/polling loops
+            connect_timeout=3,
+            read_timeout=10,
+            retries={'max_attempts': 2, 'mode': 'adaptive'}
+        )
+    )
+
+# Short-lived cache of Describe* responses keyed by (operation, filter signature),
+# so one orchestration run does not repeat identical lookups.
+_DESCRIBE_CACHE: Dict[Tuple[str, Tuple], Tuple[float, Dict[str, Any]]] = {}
+_DESCRIBE_CACHE_TTL = 30.0  # seconds
+
+# In-memory index of (resource type, Name tag) -> resource ID, built on demand
+# from a single describe_tags sweep so the get_*_id helpers become dict lookups
+_TAG_INDEX: Optional[Dict[Tuple[str, str], str]] = None
+
+def clear_describe_cache() -> None:
+    """Drop all cached Describe* responses, e.g. after mutating resources."""
+    global _TAG_INDEX
+    _DESCRIBE_CACHE.clear()
+    _TAG_INDEX = None
+
+def build_tag_index(client: boto3.client, bti_tag_env: str) -> Dict[Tuple[str, str], str]:
+    """
+    Build an index of tagged resource IDs with one describe_tags sweep.
+
+    One paginated call replaces the separate per-resource lookups the
+    get_*_id helpers would otherwise issue during an orchestration run; the
+    helpers consult this index first and fall back to the network on a miss.
 
-# Load configuration from config.json
-with open('config.json', 'r') as config_file:
-    config = json.load(config_file)
+    Args:
+        client (boto3.client): The EC2 client used to interact with AWS.
+        bti_tag_env (str): The Environment tag value to index, e.g. 'Dev'.
+
+    Returns:
+        Dict[Tuple[str, str], str]: Mapping of (resource type, Name tag value)
+        to resource ID, e.g. ('vpc', 'AcmeLabs-Dev') -> 'vpc-0123'.
+    """
+    global _TAG_INDEX
+    bti_names: Dict[str, Tuple[str, str]] = {}  # resource ID -> (resource type, Name value)
+    bti_envs: Dict[str, str] = {}  # resource ID -> Environment value
+
+    # describe_tags only filters on key/value, so fetch both tags in one
+    # sweep and join them in-process by resource ID
+    for bti_tag in client.get_paginator('describe_tags').paginate(
+        Filters=[{'Name': 'key', 'Values': ['Name', 'Environment']}]
+    ).search('Tags[]'):
+        if bti_tag['Key'] == 'Name':
+            bti_names[bti_tag['ResourceId']] = (bti_tag['ResourceType'], bti_tag['Value'])
+        else:
+            bti_envs[bti_tag['ResourceId']] = bti_tag['Value']
+
+    _TAG_INDEX = {
+        bti_type_and_name: bti_resource_id
+        for bti_resource_id, bti_type_and_name in bti_names.items()
+        if bti_envs.get(bti_resource_id) == bti_tag_env
+    }
+    return _TAG_INDEX
+
+def _cached_describe(client: boto3.client, operation: str, filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Call a Describe* operation, serving repeated identical calls from a TTL cache.
+
+    Args:
+        client (boto3.client): The EC2 client used to interact with AWS.
+        operation (str): The name of the describe method, e.g. 'describe_vpcs'.
+        filters (List[Dict[str, Any]]): The Filters list for the call.
+
+    Returns:
+        Dict[str, Any]: The (possibly cached) API response.
+    """
+    cache_key = (operation, tuple((f['Name'], tuple(f['Values'])) for f in filters))
+    now = time.monotonic()
+    cached = _DESCRIBE_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < _DESCRIBE_CACHE_TTL:
+        return cached[1]
+    response = getattr(client, operation)(Filters=filters)
+    _DESCRIBE_CACHE[cache_key] = (now, response)
+    return response
 
-def vpc_exists(client: boto3.client, a_cidr: str, a_tag_name: str, a_tag_env: str) -> Tuple[bool, str]:
+@functools.lru_cache(maxsize=None)
+def get_tagging_client(region_name: Optional[str] = None) -> boto3.client:
+    """
+    Return a shared Resource Groups Tagging API client.
+
+    Args:
+        region_name (Optional[str]): The AWS region for the client, or None for the default.
+
+    Returns:
+        boto3.client: The shared resourcegroupstaggingapi client.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        'resourcegroupstaggingapi',
+        region_name=region_name,
+        config=Config(retries={'max_attempts': 2, 'mode': 'adaptive'})
+    )
+
+def _get_resource_id_by_tags(resource_type: str, tag_name: str, tag_env: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve a tagged EC2 resource ID via the Resource Groups Tagging API.
+
+    GetResources returns only the matching ARNs instead of full resource
+    objects, so the response size tracks the number of matches rather than
+    the size of the account. Results share the module's describe TTL cache.
+
+    Args:
+        resource_type (str): The tagging API resource type filter, e.g. 'ec2:vpc'.
+        tag_name (str): The Name tag value to match.
+        tag_env (Optional[str]): The Environment tag value to match, if any.
+
+    Returns:
+        Optional[str]: The resource ID, or None if no resource matches.
+    """
+    # A populated tag index answers without any network call; the tagging-API
+    # type 'ec2:vpc' maps to describe_tags' bare 'vpc'
+    if _TAG_INDEX is not None:
+        indexed_id = _TAG_INDEX.get((resource_type.partition(':')[2], tag_name))
+        if indexed_id:
+            return indexed_id
+
+    tag_filters = [{'Key': 'Name', 'Values': [tag_name]}]
+    if tag_env:
+        tag_filters.append({'Key': 'Environment', 'Values': [tag_env]})
+
+    cache_key = ('get_resources', (resource_type, tag_name, tag_env))
+    now = time.monotonic()
+    cached = _DESCRIBE_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < _DESCRIBE_CACHE_TTL:
+        response = cached[1]
+    else:
+        response = get_tagging_client().get_resources(
+            TagFilters=tag_filters,
+            ResourceTypeFilters=[resource_type]
+        )
+        _DESCRIBE_CACHE[cache_key] = (now, response)
+
+    mappings = response['ResourceTagMappingList']
+    if not mappings:
+        return None
+    # The resource ID is the last path segment of the ARN, e.g. ...:vpc/vpc-0123
+    return mappings[0]['ResourceARN'].rsplit('/', 1)[-1]
+
+def _cached_describe_first_page(client: boto3.client, operation: str, filters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fetch only the first page of a Describe* operation, with TTL caching.
+
+    Existence checks only need to know whether anything matches, so cap the
+    result at one item via the paginator instead of materializing every page.
+
+    Args:
+        client (boto3.client): The EC2 client used to interact with AWS.
+        operation (str): The name of the describe method, e.g. 'describe_vpcs'.
+        filters (List[Dict[str, Any]]): The Filters list for the call.
+
+    Returns:
+        Dict[str, Any]: The first (possibly cached) page of the response.
+    """
+    cache_key = (f'{operation}#first', tuple((f['Name'], tuple(f['Values'])) for f in filters))
+    now = time.monotonic()
+    cached = _DESCRIBE_CACHE.get(cache_key)
+    if cached is not None and now - cached[0] < _DESCRIBE_CACHE_TTL:
+        return cached[1]
+    page = next(iter(
+        client.get_paginator(operation).paginate(
+            Filters=filters,
+            PaginationConfig={'MaxItems': 1}
+        )
+    ))
+    _DESCRIBE_CACHE[cache_key] = (now, page)
+    return page
+
+def vpc_exists(client: boto3.client, a_cidr: str, a_tag_name: str, a_tag_env: str, a_vpc_id: Optional[str] = None) -> Tuple[bool, str]:
     """
     Check if a VPC exists with the specified CIDR block and tags.
 
@@ -16,24 +259,37 @@ def vpc_exists(client: boto3.client, a_cidr: str, a_tag_name: str, a_tag_env: st
         a_cidr (str): The CIDR block of the VPC to check.
         a_tag_name (str): The name tag of the VPC to check.
         a_tag_env (str): The environment tag of the VPC to check.
+        a_vpc_id (Optional[str]): A known VPC ID, e.g. from a just-finished
+            create; when given, the check is a direct describe-by-ID instead
+            of a tag-filter scan.
 
     Returns:
         Tuple[bool, str]: (True if VPC exists, False otherwise, error message if applicable).
     """
     try:
-        # Describe VPCs based on the provided filters
-        a_response = client.describe_vpcs(
-            Filters=[
+        if a_vpc_id:
+            # Known-ID lookups short-circuit the tag-scanning backend path
+            try:
+                a_response = client.describe_vpcs(VpcIds=[a_vpc_id])
+                return (bool(a_response['Vpcs']), "")
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'InvalidVpcID.NotFound':
+                    return (False, "")
+                raise
+        # Fetch at most one matching VPC (served from cache when fresh)
+        a_response = _cached_describe_first_page(
+            client, 'describe_vpcs',
+            [
                 {'Name': 'cidr', 'Values': [a_cidr]},  # Filter by CIDR block
                 {'Name': 'tag:Name', 'Values': [a_tag_name]},  # Filter by Name tag
                 {'Name': 'tag:Environment', 'Values': [a_tag_env]}  # Filter by Environment tag
             ]
         )
-        return (len(a_response['Vpcs']) > 0, "")
+        return (bool(a_response['Vpcs']), "")
     except ClientError as e:
         return (False, f"Error checking VPC existence: {e}")
 
-def subnet_exists(client: boto3.client, b_cidr_block: str, b_tag_name: str, b_tag_env , b_vpc_id: str, b_availability_zone: str) -> Tuple[bool, Optional[str]]:
+def subnet_exists(client: boto3.client, b_cidr_block: str, b_tag_name: str, b_tag_env , b_vpc_id: str, b_availability_zone: str, b_subnet_id: Optional[str] = None) -> Tuple[bool, Optional[str]]:
     """
     Check if a subnet exists based on CIDR block, tag name, VPC ID, and availability zone.
 
@@ -44,14 +300,26 @@ def subnet_exists(client: boto3.client, b_cidr_block: str, b_tag_name: str, b_ta
         b_tag_env (str): Environment tag of the subnet.
         b_vpc_id (str): VPC ID of the subnet.
         b_availability_zone (str): Availability zone of the subnet.
+        b_subnet_id (Optional[str]): A known subnet ID; when given, the check
+            is a direct describe-by-ID instead of a tag-filter scan.
 
     Returns:
         Tuple[bool, Optional[str]]: (True if subnet exists, error message if applicable).
     """
     try:
-        # Describe the subnets with the given filters
-        b_response = client.describe_subnets(
-            Filters=[
+        if b_subnet_id:
+            # Known-ID lookups short-circuit the tag-scanning backend path
+            try:
+                b_response = client.describe_subnets(SubnetIds=[b_subnet_id])
+                return bool(b_response['Subnets']), None
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'InvalidSubnetID.NotFound':
+                    return False, None
+                raise
+        # Fetch at most one matching subnet (served from cache when fresh)
+        b_response = _cached_describe_first_page(
+            client, 'describe_subnets',
+            [
                 {'Name': 'cidr-block', 'Values': [b_cidr_block]},  # Filter by CIDR block
                 {'Name': 'tag:Name', 'Values': [b_tag_name]},  # Filter by tag name
                 {'Name': 'tag:Environment', 'Values': [b_tag_env]},  # Filter by environment tag
@@ -59,7 +327,7 @@ def subnet_exists(client: boto3.client, b_cidr_block: str, b_tag_name: str, b_ta
                 {'Name': 'availability-zone', 'Values': [b_availability_zone]}  # Filter by availability zone
             ]
         )
-        b_exists = len(b_response['Subnets']) > 0  # Check if any subnets were found
+        b_exists = bool(b_response['Subnets'])  # Check if any subnets were found
         return b_exists, None  # Return existence status and no error
     except ClientError as e:
         return False, f"Error describing subnets: {e}"  # Return error message
@@ -78,15 +346,16 @@ def route_table_exists(client: boto3.client, c_tag_name: str, c_tag_env: str, c_
         bool: True if the route table exists, False otherwise.
     """
     try:
-        # Describe route tables with specified filters
-        c_response = client.describe_route_tables(
-            Filters=[
+        # Fetch at most one matching route table (served from cache when fresh)
+        c_response = _cached_describe_first_page(
+            client, 'describe_route_tables',
+            [
                 {'Name': 'tag:Name', 'Values': [c_tag_name]},  # Filter for the Name tag
                 {'Name': 'tag:Environment', 'Values': [c_tag_env]},  # Filter for the Environment tag
                 {'Name': 'vpc-id', 'Values': [c_vpc_id]}  # Filter for the VPC ID
             ]
         )
-        return len(c_response['RouteTables']) > 0  # Return True if any route tables are found
+        return bool(c_response['RouteTables'])  # Return True if any route tables are found
     except ClientError:
         return False  # Handle client error and return False
 
@@ -103,14 +372,15 @@ def internet_gateway_exists(client: boto3.client, d_tag_name: str, d_tag_env: st
         bool: True if the Internet Gateway exists, False otherwise.
     """
     try:
-        # Describe Internet Gateways with specified filters
-        d_response = client.describe_internet_gateways(
-            Filters=[
+        # Fetch at most one matching Internet Gateway (served from cache when fresh)
+        d_response = _cached_describe_first_page(
+            client, 'describe_internet_gateways',
+            [
                 {'Name': 'tag:Name', 'Values': [d_tag_name]},
                 {'Name': 'tag:Environment', 'Values': [d_tag_env]}
             ]
         )
-        return len(d_response['InternetGateways']) > 0  # Return True if any Internet Gateways match the filters
+        return bool(d_response['InternetGateways'])  # Return True if any Internet Gateways match the filters
     except ClientError as e:
         return False  # Simply return False on error
 
@@ -126,76 +396,70 @@ def get_vpc_id(client: boto3.client) -> Tuple[Optional[str], Optional[str]]:
         Tuple[Optional[str], Optional[str]]: The VPC ID if the VPC exists, or an error message.
     """
     try:
-        e_response = client.describe_vpcs(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [config["TAG_VPC_NAME"]]},
-                {'Name': 'tag:Environment', 'Values': [config["TAG_ENV"]]}
-            ]
-        )
-        if e_response['Vpcs']:
-            return e_response['Vpcs'][0]['VpcId'], None
+        e_vpc_id = _get_resource_id_by_tags('ec2:vpc', _TAG_VPC_NAME, _TAG_ENV)
+        if e_vpc_id:
+            return e_vpc_id, None
         else:
             return None, "No matching VPC found."
     except ClientError as e:
         return None, f"Error checking VPC existence: {e}"
 
-def get_route_table_id(client: boto3.client, f_tag_name: str) -> Union[str, str]:
+def get_route_table_id(client: boto3.client, f_tag_name: str, f_tag_env: Optional[str] = None) -> str:
     """
     Retrieve the Route Table ID based on the given tag.
 
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
         f_tag_name (str): The tag name of the route table to retrieve.
+        f_tag_env (Optional[str]): The environment tag to match as well,
+            narrowing the lookup server-side.
 
     Returns:
-        Union[str, str]: The Route Table ID or an error message.
+        str: The Route Table ID.
+
+    Raises:
+        ResourceNotFound: If no route table carries the tag.
+        AWSOpError: If the lookup itself fails.
     """
     try:
-        f_response = client.describe_route_tables(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [f_tag_name]}
-            ]
-        )
-        if f_response['RouteTables']:
-            return f_response['RouteTables'][0]['RouteTableId']
-        else:
-            return f"No route table found with tag: {f_tag_name}"
+        f_rtb_id = _get_resource_id_by_tags('ec2:route-table', f_tag_name, f_tag_env)
     except ClientError as e:
-        return f"Client error retrieving route table ID: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Error retrieving route table ID: {str(e)}"
+        raise AWSOpError(f"Client error retrieving route table ID: {e.response['Error']['Message']}") from e
+    if f_rtb_id:
+        return f_rtb_id
+    raise ResourceNotFound(f"No route table found with tag: {f_tag_name}")
 
-def get_internet_gateway_id(client: boto3.client, g_tag_name: str) -> Tuple[Optional[str], Optional[str]]:
+def get_internet_gateway_id(client: boto3.client, g_tag_name: str, g_tag_env: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
     """
     Check if an Internet Gateway exists with the specified name tag.
 
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
         g_tag_name (str): The name of the tag to filter the Internet Gateway.
+        g_tag_env (Optional[str]): The environment tag to match as well,
+            narrowing the lookup server-side.
 
     Returns:
         Tuple[Optional[str], Optional[str]]: The Internet Gateway ID if it exists, or an error message.
     """
     try:
-        g_response = client.describe_internet_gateways(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [g_tag_name]}
-            ]
-        )
-        if g_response['InternetGateways']:
-            return g_response['InternetGateways'][0]['InternetGatewayId'], None
+        g_igw_id = _get_resource_id_by_tags('ec2:internet-gateway', g_tag_name, g_tag_env)
+        if g_igw_id:
+            return g_igw_id, None
         else:
             return None, "No Internet Gateway found with the specified tag."
     except ClientError as e:
         return None, f"Error checking Internet Gateway existence: {e}"
 
-def get_subnet_info(client: boto3.client, h_tag_name_prefix: str) -> Tuple[Union[Dict[str, Dict[str, str]], str], Union[List[str], str]]:
+def get_subnet_info(client: boto3.client, h_tag_name_prefix: str, h_tag_env: Optional[str] = None) -> Tuple[Union[Dict[str, Dict[str, str]], str], Union[List[str], str]]:
     """
     Get subnet information based on the specified tag prefix.
 
     Args:
         client: Boto3 EC2 client.
         h_tag_name_prefix: The starting prefix for the subnet names.
+        h_tag_env: The environment tag to match as well, narrowing the
+            describe server-side.
 
     Returns:
         A tuple containing a dictionary of subnet details and a list of subnet IDs or an error message.
@@ -206,29 +470,34 @@ def get_subnet_info(client: boto3.client, h_tag_name_prefix: str) -> Tuple[Union
             'Values': [f'{h_tag_name_prefix}*']
         }
     ]
+    if h_tag_env:
+        h_filters.append({'Name': 'tag:Environment', 'Values': [h_tag_env]})
 
     try:
-        h_response = client.describe_subnets(Filters=h_filters)['Subnets']
+        h_response = _cached_describe(client, 'describe_subnets', h_filters)['Subnets']
         h_subnet_details = {}
         h_subnet_ids = []
 
         for h_subnet in h_response:
-            if 'Tags' in h_subnet:
-                for tag in h_subnet['Tags']:
-                    if tag['Key'] == 'Name' and tag['Value'].startswith(h_tag_name_prefix):
-                        h_subnet_ids.append(h_subnet['SubnetId'])
-                        h_subnet_details[h_subnet['SubnetId']] = {
-                            'Subnet ID': h_subnet['SubnetId'],
-                            'CIDR Block': h_subnet['CidrBlock'],
-                            'Availability Zone': h_subnet['AvailabilityZone'],
-                            'VPC ID': h_subnet['VpcId']
-                        }
+            # Stop scanning this subnet's tags at the first matching Name tag
+            h_name_tag = next(
+                (tag for tag in h_subnet.get('Tags', ())
+                 if tag['Key'] == 'Name' and tag['Value'].startswith(h_tag_name_prefix)),
+                None
+            )
+            if h_name_tag is not None:
+                h_subnet_id = h_subnet['SubnetId']
+                h_subnet_ids.append(h_subnet_id)
+                h_subnet_details[h_subnet_id] = {
+                    'Subnet ID': h_subnet_id,
+                    'CIDR Block': h_subnet['CidrBlock'],
+                    'Availability Zone': h_subnet['AvailabilityZone'],
+                    'VPC ID': h_subnet['VpcId']
+                }
 
         return h_subnet_details, h_subnet_ids
     except ClientError as e:
         return {}, f"Client error retrieving subnet information: {e.response['Error']['Message']}"
-    except Exception as e:
-        return {}, f"Error retrieving subnet information: {str(e)}"
 
 def create_vpc(client: boto3.client, i_cidr_block: str, i_tag_name: str, i_tag_env: str) -> Tuple[str, str]:
     """
@@ -257,7 +526,14 @@ def create_vpc(client: boto3.client, i_cidr_block: str, i_tag_name: str, i_tag_e
                 }
             ]
         )
-        return (i_response['Vpc']['VpcId'], "")
+        i_vpc_id = i_response['Vpc']['VpcId']
+        # Wait for the VPC to become available; the waiter handles polling backoff
+        client.get_waiter('vpc_available').wait(
+            VpcIds=[i_vpc_id],
+            WaiterConfig={'Delay': 2, 'MaxAttempts': 20}
+        )
+        clear_describe_cache()  # Cached lookups no longer reflect the new VPC
+        return (i_vpc_id, "")
     except ClientError as e:
         return ("", f"Error creating VPC: {e}")
 
@@ -272,23 +548,31 @@ def enable_dns_vpc(client: boto3.client, u_vpc_id: str) -> None:
     Returns:
     None
     """
-    # Step 1: Enable DNS support
-    client.modify_vpc_attribute(
-        VpcId=u_vpc_id,
-        EnableDnsSupport={'Value': True}
-    )
-    print(f'DNS support enabled for VPC ID: {u_vpc_id}')
-
-    # Step 2: Enable DNS hostname lookups
-    client.modify_vpc_attribute(
-        VpcId=u_vpc_id,
-        EnableDnsHostnames={'Value': True}
-    )
-    print(f'DNS hostname lookups enabled for VPC ID: {u_vpc_id}')
+    # The two attribute flags are independent, so both modify calls run
+    # concurrently instead of paying two sequential round trips
+    with ThreadPoolExecutor(max_workers=2) as u_executor:
+        u_support = u_executor.submit(
+            client.modify_vpc_attribute,
+            VpcId=u_vpc_id,
+            EnableDnsSupport={'Value': True}
+        )
+        u_hostnames = u_executor.submit(
+            client.modify_vpc_attribute,
+            VpcId=u_vpc_id,
+            EnableDnsHostnames={'Value': True}
+        )
+        u_support.result()
+        print(f'DNS support enabled for VPC ID: {u_vpc_id}')
+        u_hostnames.result()
+        print(f'DNS hostname lookups enabled for VPC ID: {u_vpc_id}')
 
-def create_subnet(client: boto3.client, j_cidr_block: str, j_azs: str, j_tag_name: str, j_tag_env: str) -> Tuple[Optional[str], Optional[str]]:
+def create_subnet(client: boto3.client, j_cidr_block: str, j_azs: str, j_tag_name: str, j_tag_env: str, j_vpc_id: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
     """
-    Create a subnet if it does not already exist.
+    Create a subnet, detecting an already-existing one from the create error.
+
+    The subnet is created optimistically instead of paying a separate
+    existence-check round trip first; a CIDR conflict from EC2 is translated
+    into the usual "Subnet Exists" message.
 
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
@@ -296,28 +580,19 @@ def create_subnet(client: boto3.client, j_cidr_block: str, j_azs: str, j_tag_nam
         j_azs (str): Availability zone for the new subnet.
         j_tag_name (str): Tag name for the new subnet.
         j_tag_env (str): Environment tag for the new subnet.
+        j_vpc_id (Optional[str]): The VPC to create the subnet in; resolved via
+            get_vpc_id when not supplied, so callers creating several subnets
+            should resolve it once and pass it in.
 
     Returns:
         Tuple[Optional[str], Optional[str]]: Subnet ID if created, error message if applicable.
     """
-    # Get the VPC ID to create the subnet in
-    j_vpc_id, j_vpc_error = get_vpc_id(client)
-    if j_vpc_error:
-        return None, j_vpc_error  # Return an error if the VPC ID could not be retrieved
-
-    # Check if the subnet already exists
-    j_exists, j_error_message = subnet_exists(client, j_cidr_block, j_tag_name, j_tag_env, j_vpc_id, j_azs)
-    if j_error_message:
-        return None, j_error_message  # Return the error if it occurred
-
-    if j_exists:
-        # Return an error message if the subnet already exists
-        return (None, f"Subnet Exists:\n"
-                      f"    Name: {j_tag_name}\n"
-                      f"    Environment: {j_tag_env}\n"
-                      f"    CIDR Block: {j_cidr_block}\n"
-                      f"    Availability Zone: {j_azs}"
-                )
+    if j_vpc_id is None:
+        # Get the VPC ID to create the subnet in
+        j_vpc_id, j_vpc_error = get_vpc_id(client)
+        if j_vpc_error:
+            return None, j_vpc_error  # Return an error if the VPC ID could not be retrieved
+
     try:
         # Create a new subnet with the specified parameters
         j_public_subnet = client.create_subnet(
@@ -326,7 +601,7 @@ def create_subnet(client: boto3.client, j_cidr_block: str, j_azs: str, j_tag_nam
                     'ResourceType': 'subnet',
                     'Tags': [
                         {'Key': 'Name', 'Value': j_tag_name},  # Tag for the subnet name
-                        {'Key': 'Environment', 'Value': config['TAG_ENV']}  # Tag for the environment
+                        {'Key': 'Environment', 'Value': _TAG_ENV}  # Tag for the environment
                     ]
                 }
             ],
@@ -335,8 +610,22 @@ def create_subnet(client: boto3.client, j_cidr_block: str, j_azs: str, j_tag_nam
             VpcId=j_vpc_id  # Specify the VPC ID to create the subnet in
         )
         j_subnet_id = j_public_subnet['Subnet']['SubnetId']  # Get the ID of the created subnet
+        # Wait for the subnet to become available; the waiter handles polling backoff
+        client.get_waiter('subnet_available').wait(
+            SubnetIds=[j_subnet_id],
+            WaiterConfig={'Delay': 2, 'MaxAttempts': 20}
+        )
+        clear_describe_cache()  # Cached lookups no longer reflect the new subnet
         return j_subnet_id, None  # Return the subnet ID and no error
     except ClientError as e:
+        if e.response['Error']['Code'] in ('InvalidSubnet.Conflict', 'InvalidSubnet.Range'):
+            # The CIDR block is already taken; report the existing subnet
+            return (None, f"Subnet Exists:\n"
+                          f"    Name: {j_tag_name}\n"
+                          f"    Environment: {j_tag_env}\n"
+                          f"    CIDR Block: {j_cidr_block}\n"
+                          f"    Availability Zone: {j_azs}"
+                    )
         return None, f"Error creating subnet: {e}"  # Return error message
 
 def associate_route_table(client: boto3.client, k_subnets: List[str], k_rtb: str) -> List[Tuple[str, Union[Dict[str, str], str]]]:
@@ -351,21 +640,24 @@ def associate_route_table(client: boto3.client, k_subnets: List[str], k_rtb: str
     Returns:
         List[Tuple[str, Union[Dict[str, str], str]]]: A list of tuples containing subnet IDs and the corresponding response or error message.
     """
-    k_results = []
-    for k_subnet in k_subnets:
+    def k_associate(k_subnet: str) -> Tuple[str, Union[Dict[str, str], str]]:
         try:
             # Associate the route table with the subnet
             k_response = client.associate_route_table(
                 SubnetId=k_subnet,
                 RouteTableId=k_rtb
             )
-            k_results.append((k_subnet, k_response))
+            return k_subnet, k_response
         except ClientError as e:
-            k_results.append((k_subnet, f"Client error associating Route Table: {e.response['Error']['Message']}"))
-        except Exception as e:
-            k_results.append((k_subnet, f"Error associating Route Table: {str(e)}"))
+            return k_subnet, f"Client error associating Route Table: {e.response['Error']['Message']}"
+
+    if not k_subnets:
+        return []
 
-    return k_results
+    # The associations are independent; issue them concurrently on the shared client
+    # (botocore clients are thread-safe) and keep results in subnet order.
+    with ThreadPoolExecutor(max_workers=min(16, len(k_subnets))) as k_executor:
+        return list(k_executor.map(k_associate, k_subnets))
 
 def create_internet_gateway(client: boto3.client) -> str:
     """
@@ -378,21 +670,14 @@ def create_internet_gateway(client: boto3.client) -> str:
         str: The ID of the created Internet Gateway or an error message.
     """
     try:
-        # Create the Internet Gateway with specified tags
+        # Create the Internet Gateway with the precomputed tag specification
         l_response = client.create_internet_gateway(
-            TagSpecifications=[
-                {
-                    'ResourceType': 'internet-gateway',
-                    'Tags': [
-                        {'Key': 'Name', 'Value': config['TAG_IGW_NAME']},
-                        {'Key': 'Environment', 'Value': config['TAG_ENV']}
-                    ]
-                }
-            ]
+            TagSpecifications=_IGW_TAG_SPECIFICATIONS
         )
 
         # Access the Internet Gateway object from the response
         l_igw = l_response['InternetGateway']
+        clear_describe_cache()  # Cached lookups no longer reflect the new Internet Gateway
 
         # Return the ID of the created Internet Gateway
         return l_igw['InternetGatewayId']  # Return the ID of the created Internet Gateway
@@ -400,6 +685,41 @@ def create_internet_gateway(client: boto3.client) -> str:
     except ClientError as e:
         return f"Error creating Internet Gateway: {e.response['Error']['Message']}"
 
+def create_network_resources(client: boto3.client, v_subnet_specs: List[Tuple[str, str, str, str]], v_vpc_id: Optional[str] = None) -> Tuple[str, List[Tuple[Optional[str], Optional[str]]]]:
+    """
+    Create the Internet Gateway and all subnets concurrently.
+
+    The gateway does not depend on any subnet, and subnets in different
+    availability zones are independent of each other, so all creations are
+    submitted to one shared thread pool instead of running back to back.
+    Dependent steps (attach_internet_gateway, create_route) still belong to
+    the caller, which runs them once these results are in.
+
+    Args:
+        client (boto3.client): The EC2 client used to interact with AWS.
+        v_subnet_specs (List[Tuple[str, str, str, str]]): One
+            (cidr_block, availability_zone, tag_name, tag_env) tuple per subnet.
+        v_vpc_id (Optional[str]): The VPC to create the subnets in; resolved
+            via get_vpc_id when not supplied.
+
+    Returns:
+        Tuple[str, List[Tuple[Optional[str], Optional[str]]]]: The
+        create_internet_gateway result and the create_subnet results in
+        input order.
+    """
+    if v_vpc_id is None:
+        v_vpc_id, v_vpc_error = get_vpc_id(client)
+        if v_vpc_error:
+            return v_vpc_error, []
+
+    with ThreadPoolExecutor(max_workers=8) as v_executor:
+        v_igw_future = v_executor.submit(create_internet_gateway, client)
+        v_subnet_futures = [
+            v_executor.submit(create_subnet, client, v_cidr, v_az, v_tag_name, v_tag_env, v_vpc_id)
+            for v_cidr, v_az, v_tag_name, v_tag_env in v_subnet_specs
+        ]
+        return v_igw_future.result(), [v_future.result() for v_future in v_subnet_futures]
+
 def attach_internet_gateway(client: boto3.client, m_vpc_id: str, m_igw_id: str) -> Tuple[bool, str]:
     """
     Attach an Internet Gateway to the specified VPC.
@@ -448,20 +768,22 @@ def create_route(client: boto3.client, n_dest_cidr_block: str, n_igw_id: str, n_
             return None, "Route creation failed, no RouteTableId returned."
     except ClientError as e:
         return None, f"Error creating route: {e.response['Error']['Message']}"
-    except Exception as e:
-        return None, f"Error creating route: {str(e)}"
 
-def delete_route(client: boto3.client, o_rtb_id: str, o_dest_cidr_block: str) -> str:
+def delete_route(client: boto3.client, o_rtb_id: str, o_dest_cidr_block: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Delete a route from the specified Route Table.
 
+    Returns structured data instead of a preformatted message so callers
+    only pay string-formatting cost when they actually print the result.
+
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
         o_rtb_id (str): The ID of the Route Table from which to delete the route.
         o_dest_cidr_block (str): The destination CIDR block of the route to delete.
 
     Returns:
-        str: A success or error message.
+        Tuple[bool, Dict[str, Any]]: (True, result details) on success, or
+        (False, {'error': message}) on failure.
     """
     try:
         o_response = client.delete_route(
@@ -469,14 +791,12 @@ def delete_route(client: boto3.client, o_rtb_id: str, o_dest_cidr_block: str) ->
             DestinationCidrBlock=o_dest_cidr_block
         )
         if o_response['ResponseMetadata']['HTTPStatusCode'] != 200:
-            return f"Failed to delete route: {o_response}"
-        return f"Route deleted successfully from Route Table {o_rtb_id} for CIDR block {o_dest_cidr_block}"
+            return False, {'error': f"Failed to delete route: {o_response}"}
+        return True, {'route_table_id': o_rtb_id, 'dest_cidr_block': o_dest_cidr_block}
     except ClientError as e:
-        return f"Client error deleting route: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Error deleting route: {str(e)}"
+        return False, {'error': f"Client error deleting route: {e.response['Error']['Message']}"}
 
-def detach_internet_gateway(client: boto3.client, p_igw_id: str, p_vpc_id: str) -> str:
+def detach_internet_gateway(client: boto3.client, p_igw_id: str, p_vpc_id: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Detach an Internet Gateway from a specified VPC.
 
@@ -486,7 +806,8 @@ def detach_internet_gateway(client: boto3.client, p_igw_id: str, p_vpc_id: str)
         p_vpc_id (str): The ID of the VPC from which to detach the Internet Gateway.
 
     Returns:
-        str: A message indicating the result of the detach operation.
+        Tuple[bool, Dict[str, Any]]: (True, result details) on success, or
+        (False, {'error': message}) on failure.
     """
     try:
         p_response = client.detach_internet_gateway(
@@ -494,11 +815,11 @@ def detach_internet_gateway(client: boto3.client, p_igw_id: str, p_vpc_id: str)
             VpcId=p_vpc_id,
         )
         if p_response['ResponseMetadata']['HTTPStatusCode'] == 200:
-            return f"Internet Gateway {p_igw_id} detached from VPC {p_vpc_id} successfully."
+            return True, {'igw_id': p_igw_id, 'vpc_id': p_vpc_id}
         else:
-            return f"Failed to detach Internet Gateway {p_igw_id} from VPC {p_vpc_id}. HTTP Status Code: {p_response['ResponseMetadata']['HTTPStatusCode']}"
+            return False, {'error': f"Failed to detach Internet Gateway {p_igw_id} from VPC {p_vpc_id}. HTTP Status Code: {p_response['ResponseMetadata']['HTTPStatusCode']}"}
     except ClientError as e:
-        return f"Client error detaching Internet Gateway: {e.response['Error']['Message']}"
+        return False, {'error': f"Client error detaching Internet Gateway: {e.response['Error']['Message']}"}
 
 def delete_internet_gateway(client: boto3.client, q_igw_id: str) -> str:
     """
@@ -519,7 +840,7 @@ def delete_internet_gateway(client: boto3.client, q_igw_id: str) -> str:
     except ClientError as e:
         return f"Error deleting Internet Gateway: {e}"
 
-def disassociate_subnets_from_route_table(client: boto3.client, r_tag_name: str) -> Union[str, str]:
+def disassociate_subnets_from_route_table(client: boto3.client, r_tag_name: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Disassociate non-main subnets from a route table identified by the given tag.
 
@@ -528,35 +849,40 @@ def disassociate_subnets_from_route_table(client: boto3.client, r_tag_name: str)
         r_tag_name (str): The tag name of the route table from which to disassociate subnets.
 
     Returns:
-        str: A message indicating the result of the disassociation operation or an error message.
+        Tuple[bool, Dict[str, Any]]: (True, result details with the removed
+        subnet IDs) on success, or (False, {'error': message}) on failure.
     """
     try:
         r_route_table_id = get_route_table_id(client, r_tag_name)
-        if isinstance(r_route_table_id, str) and r_route_table_id.startswith("No route table found"):
-            return r_route_table_id
-
-        r_disassociation_count = 0
-        r_removed_subnets = []
+    except (ResourceNotFound, AWSOpError) as e:
+        return False, {'error': str(e)}
 
-        r_associations = client.describe_route_tables(RouteTableIds=[r_route_table_id])['RouteTables'][0]['Associations']
-
-        for r_response in r_associations:
-            if not r_response['Main']:
-                client.disassociate_route_table(AssociationId=r_response['RouteTableAssociationId'])
-                r_disassociation_count += 1
-                r_removed_subnets.append(r_response['SubnetId'])
+    try:
 
-        if r_disassociation_count > 0:
-            return (f"Successfully disassociated {r_disassociation_count} subnet(s) from route table {r_route_table_id}. \n"
-                    f"Removed subnets: {', '.join(r_removed_subnets)}.")
-        else:
-            return f"No non-main subnets found associated with route table {r_route_table_id}."
+        # Project out just the associations with JMESPath instead of
+        # materializing the full route-table payload
+        r_associations = client.get_paginator('describe_route_tables').paginate(
+            RouteTableIds=[r_route_table_id]
+        ).search('RouteTables[].Associations[]')
+
+        # Collect the non-main associations first, then disassociate them
+        # concurrently; each disassociation is independent of the others
+        r_non_main = [r_response for r_response in r_associations if not r_response['Main']]
+        r_removed_subnets = [r_response['SubnetId'] for r_response in r_non_main]
+
+        if r_non_main:
+            with ThreadPoolExecutor(max_workers=min(16, len(r_non_main))) as r_executor:
+                list(r_executor.map(
+                    lambda r_assoc: client.disassociate_route_table(
+                        AssociationId=r_assoc['RouteTableAssociationId']
+                    ),
+                    r_non_main
+                ))
+        return True, {'route_table_id': r_route_table_id, 'removed_subnets': r_removed_subnets}
     except ClientError as e:
-        return f"Client error disassociating subnet from route table: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Error disassociating subnet from route table: {str(e)}"
+        return False, {'error': f"Client error disassociating subnet from route table: {e.response['Error']['Message']}"}
 
-def delete_route_table(client: boto3.client, s_rtb_id: str) -> str:
+def delete_route_table(client: boto3.client, s_rtb_id: str) -> Tuple[bool, Dict[str, Any]]:
     """
     Delete a Route Table by its ID.
 
@@ -565,20 +891,19 @@ def delete_route_table(client: boto3.client, s_rtb_id: str) -> str:
         s_rtb_id (str): The ID of the route table to delete.
 
     Returns:
-        str: Success or error message regarding the deletion.
+        Tuple[bool, Dict[str, Any]]: (True, result details) on success, or
+        (False, {'error': message}) on failure.
     """
     try:
         s_response = client.delete_route_table(
             RouteTableId=s_rtb_id
         )
         if s_response['ResponseMetadata']['HTTPStatusCode'] == 200:
-            return f"Route Table {s_rtb_id} deleted successfully."
+            return True, {'route_table_id': s_rtb_id}
         else:
-            return f"Failed to delete Route Table {s_rtb_id}. HTTP Status Code: {s_response['ResponseMetadata']['HTTPStatusCode']}"
+            return False, {'error': f"Failed to delete Route Table {s_rtb_id}. HTTP Status Code: {s_response['ResponseMetadata']['HTTPStatusCode']}"}
     except ClientError as e:
-        return f"Client error deleting route table: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Error deleting route table: {str(e)}"
+        return False, {'error': f"Client error deleting route table: {e.response['Error']['Message']}"}
 
 def delete_vpc(client: boto3.client, t_vpc_id: str) -> Optional[str]:
     """
@@ -596,5 +921,3 @@ def delete_vpc(client: boto3.client, t_vpc_id: str) -> Optional[str]:
         return t_response.get('ResponseMetadata', {}).get('HTTPStatusCode', None)
     except ClientError as e:
         return f"Error deleting VPC: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Unexpected error deleting VPC: {str(e)}"
@@ -0,0 +1,265 @@
+"""
+Async twins of the creation helpers in helper.py, built on aioboto3.
+
+These let orchestration code fan out independent AWS calls without threads:
+
+    session = get_session()
+    async with session.client('ec2') as client:
+        results = await asyncio.gather(
+            *(create_subnet(client, cidr, az, tag, env, vpc_id)
+              for cidr, az, tag in subnet_specs)
+        )
+
+aioboto3 is an optional dependency: importing this module without it is
+harmless, and get_session() raises a clear error only when a session is
+actually requested, so the sync helpers keep working unchanged.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError
+
+from helper import config
+
+try:
+    import aioboto3
+except ImportError:  # Optional dependency; see get_session()
+    aioboto3 = None
+
+# Configuration values shared with the sync helpers
+_TAG_VPC_NAME = config['TAG_VPC_NAME']
+_TAG_ENV = config['TAG_ENV']
+_TAG_IGW_NAME = config['TAG_IGW_NAME']
+
+_session = None
+
+def get_session() -> "aioboto3.Session":
+    """
+    Return a shared aioboto3 session, creating it on first use.
+
+    Returns:
+        aioboto3.Session: The shared session.
+
+    Raises:
+        ImportError: If aioboto3 is not installed.
+    """
+    global _session
+    if aioboto3 is None:
+        raise ImportError("aioboto3 is required for the async helpers; install it or use helper.py")
+    if _session is None:
+        _session = aioboto3.Session()
+    return _session
+
+async def get_vpc_id(client: Any) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Retrieve the VPC ID for the configured Name/Environment tags.
+
+    Args:
+        client: The aioboto3 EC2 client.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The VPC ID if the VPC exists, or an error message.
+    """
+    try:
+        gvi_response = await client.describe_vpcs(
+            Filters=[
+                {'Name': 'tag:Name', 'Values': [_TAG_VPC_NAME]},
+                {'Name': 'tag:Environment', 'Values': [_TAG_ENV]}
+            ]
+        )
+        if gvi_response['Vpcs']:
+            return gvi_response['Vpcs'][0]['VpcId'], None
+        else:
+            return None, "No matching VPC found."
+    except ClientError as e:
+        return None, f"Error checking VPC existence: {e}"
+
+async def create_vpc(client: Any, i_cidr_block: str, i_tag_name: str, i_tag_env: str) -> Tuple[str, str]:
+    """
+    Create a new VPC with the specified CIDR block and tags.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        i_cidr_block (str): The CIDR block for the VPC.
+        i_tag_name (str): The name tag for the VPC.
+        i_tag_env (str): The environment tag for the VPC.
+
+    Returns:
+        Tuple[str, str]: (VPC ID, error message if applicable).
+    """
+    try:
+        i_response = await client.create_vpc(
+            CidrBlock=i_cidr_block,
+            TagSpecifications=[
+                {
+                    'ResourceType': 'vpc',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': i_tag_name},
+                        {'Key': 'Environment', 'Value': i_tag_env}
+                    ]
+                }
+            ]
+        )
+        return (i_response['Vpc']['VpcId'], "")
+    except ClientError as e:
+        return ("", f"Error creating VPC: {e}")
+
+async def enable_dns_vpc(client: Any, u_vpc_id: str) -> None:
+    """
+    Enable DNS support and hostname lookups for the specified VPC.
+
+    The two attribute flags are independent, so both modify calls run
+    concurrently.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        u_vpc_id (str): The ID of the VPC to modify.
+    """
+    await asyncio.gather(
+        client.modify_vpc_attribute(VpcId=u_vpc_id, EnableDnsSupport={'Value': True}),
+        client.modify_vpc_attribute(VpcId=u_vpc_id, EnableDnsHostnames={'Value': True})
+    )
+
+async def create_subnet(client: Any, j_cidr_block: str, j_azs: str, j_tag_name: str, j_tag_env: str, j_vpc_id: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Create a subnet, detecting an already-existing one from the create error.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        j_cidr_block (str): CIDR block for the new subnet.
+        j_azs (str): Availability zone for the new subnet.
+        j_tag_name (str): Tag name for the new subnet.
+        j_tag_env (str): Environment tag for the new subnet.
+        j_vpc_id (Optional[str]): The VPC to create the subnet in; resolved
+            via get_vpc_id when not supplied.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: Subnet ID if created, error message if applicable.
+    """
+    if j_vpc_id is None:
+        j_vpc_id, j_vpc_error = await get_vpc_id(client)
+        if j_vpc_error:
+            return None, j_vpc_error
+
+    try:
+        j_public_subnet = await client.create_subnet(
+            TagSpecifications=[
+                {
+                    'ResourceType': 'subnet',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': j_tag_name},
+                        {'Key': 'Environment', 'Value': _TAG_ENV}
+                    ]
+                }
+            ],
+            AvailabilityZone=j_azs,
+            CidrBlock=j_cidr_block,
+            VpcId=j_vpc_id
+        )
+        return j_public_subnet['Subnet']['SubnetId'], None
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('InvalidSubnet.Conflict', 'InvalidSubnet.Range'):
+            return (None, f"Subnet Exists:\n"
+                          f"    Name: {j_tag_name}\n"
+                          f"    Environment: {j_tag_env}\n"
+                          f"    CIDR Block: {j_cidr_block}\n"
+                          f"    Availability Zone: {j_azs}"
+                    )
+        return None, f"Error creating subnet: {e}"
+
+async def create_internet_gateway(client: Any) -> str:
+    """
+    Create an Internet Gateway with the configured tags.
+
+    Args:
+        client: The aioboto3 EC2 client.
+
+    Returns:
+        str: The ID of the created Internet Gateway or an error message.
+    """
+    try:
+        l_response = await client.create_internet_gateway(
+            TagSpecifications=[
+                {
+                    'ResourceType': 'internet-gateway',
+                    'Tags': [
+                        {'Key': 'Name', 'Value': _TAG_IGW_NAME},
+                        {'Key': 'Environment', 'Value': _TAG_ENV}
+                    ]
+                }
+            ]
+        )
+        return l_response['InternetGateway']['InternetGatewayId']
+    except ClientError as e:
+        return f"Error creating Internet Gateway: {e.response['Error']['Message']}"
+
+async def attach_internet_gateway(client: Any, m_vpc_id: str, m_igw_id: str) -> Tuple[bool, Union[Dict[str, Any], str]]:
+    """
+    Attach an Internet Gateway to the specified VPC.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        m_vpc_id (str): The ID of the VPC to attach the Internet Gateway to.
+        m_igw_id (str): The ID of the Internet Gateway to attach.
+
+    Returns:
+        Tuple[bool, Union[Dict[str, Any], str]]: True and the response on success, or an error message.
+    """
+    try:
+        m_response = await client.attach_internet_gateway(
+            InternetGatewayId=m_igw_id,
+            VpcId=m_vpc_id
+        )
+        return True, m_response
+    except ClientError as e:
+        return False, f"Error attaching Internet Gateway: {e}"
+
+async def create_route(client: Any, n_dest_cidr_block: str, n_igw_id: str, n_rtb_id: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Create a route in the specified route table to direct traffic to the Internet Gateway.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        n_dest_cidr_block (str): The destination CIDR block for the route.
+        n_igw_id (str): The Internet Gateway ID.
+        n_rtb_id (str): The Route Table ID.
+
+    Returns:
+        Tuple[Optional[str], Optional[str]]: The Route Table ID or an error message.
+    """
+    try:
+        n_response = await client.create_route(
+            DestinationCidrBlock=n_dest_cidr_block,
+            GatewayId=n_igw_id,
+            RouteTableId=n_rtb_id
+        )
+        if n_response['Return']:
+            return n_rtb_id, None
+        else:
+            return None, "Route creation failed, no RouteTableId returned."
+    except ClientError as e:
+        return None, f"Error creating route: {e.response['Error']['Message']}"
+
+async def associate_route_table(client: Any, k_subnets: List[str], k_rtb: str) -> List[Tuple[str, Union[Dict[str, Any], str]]]:
+    """
+    Associate the specified route table with the given subnets concurrently.
+
+    Args:
+        client: The aioboto3 EC2 client.
+        k_subnets (List[str]): List of subnet IDs to associate.
+        k_rtb (str): The Route Table ID to associate with the subnets.
+
+    Returns:
+        List[Tuple[str, Union[Dict[str, Any], str]]]: A list of tuples containing subnet IDs and the corresponding response or error message.
+    """
+    async def k_associate(k_subnet: str) -> Tuple[str, Union[Dict[str, Any], str]]:
+        try:
+            k_response = await client.associate_route_table(
+                SubnetId=k_subnet,
+                RouteTableId=k_rtb
+            )
+            return k_subnet, k_response
+        except ClientError as e:
+            return k_subnet, f"Client error associating Route Table: {e.response['Error']['Message']}"
+
+    return list(await asyncio.gather(*(k_associate(k_subnet) for k_subnet in k_subnets)))
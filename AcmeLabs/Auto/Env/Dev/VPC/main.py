@@ -1,21 +1,57 @@
+import atexit
 import boto3
+import json
+import logging
+import queue
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from errors import ResourceNotFound, AWSOpError
+from logging.handlers import QueueHandler, QueueListener
 from helper import (
+    get_ec2_client, build_tag_index, clear_describe_cache,
     vpc_exists, route_table_exists, internet_gateway_exists,
     get_vpc_id, get_route_table_id, get_internet_gateway_id, get_subnet_info,
     create_vpc, enable_dns_vpc, create_subnet, associate_route_table,
     create_internet_gateway, attach_internet_gateway, create_route,
     delete_route, detach_internet_gateway, delete_internet_gateway,
-    disassociate_subnets_from_route_table, delete_route_table, delete_vpc
+    disassociate_subnets_from_route_table, delete_route_table, delete_vpc,
+    config
 )
-import json
 
-# Load configuration from config.json
-with open('config.json', 'r') as config_file:
-    config = json.load(config_file)
-
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+# Log records are queued by the worker threads and written out by a single
+# background listener, so concurrent operations never serialize on stdout;
+# %s arguments defer formatting until the listener consumes the record
+_log_queue = queue.SimpleQueue()
+logger = logging.getLogger('acmelabs.vpc')
+logger.setLevel(logging.INFO)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Initialize the shared EC2 client (pooled, reused across all operations)
+ec2 = get_ec2_client()
+
+def _add_default_tags(params, **kwargs) -> None:
+    """Appends the Environment tag to any Create* call that specifies tags."""
+    for tag_spec in params.get('TagSpecifications', []):
+        tags = tag_spec.setdefault('Tags', [])
+        if not any(tag['Key'] == 'Environment' for tag in tags):
+            tags.append({'Key': 'Environment', 'Value': config['TAG_ENV']})
+
+# Injecting the tag in the SDK layer means no create call from this process
+# can go out untagged, and the per-call tag dicts shrink to just the Name tag
+ec2.meta.events.register('before-parameter-build.ec2.*', _add_default_tags)
+
+# Tagged-resource IDs resolved once per run; see prime_resource_cache()
+_resource_index = {}
+
+def prime_resource_cache() -> None:
+    """Resolves all tagged resource IDs with one API sweep before the operations run."""
+    global _resource_index
+    # The helpers consult this index first, so the scattered get_*_id calls
+    # below become dict lookups instead of separate describe round trips
+    _resource_index = build_tag_index(ec2, config['TAG_ENV'])
 
 def create_vpc_operation() -> None:
     """Creates a VPC if it does not already exist."""
@@ -23,43 +59,52 @@ def create_vpc_operation() -> None:
     vpc_exists_result, vpc_exists_error = vpc_exists(ec2, config["CIDR_BLOCK"], config["TAG_VPC_NAME"], config["TAG_ENV"])
 
     if vpc_exists_result:
-        print(
-            f"VPC Exits:\n"
-            f"    Name: {config['TAG_VPC_NAME']}\n"
-            f"    Environment: {config['TAG_ENV']}\n"
-            f"    CIDR Block: {config['CIDR_BLOCK']}"
+        logger.info(
+            "VPC Exits:\n    Name: %s\n    Environment: %s\n    CIDR Block: %s",
+            config['TAG_VPC_NAME'], config['TAG_ENV'], config['CIDR_BLOCK']
         )
     else:
         vpc_id, create_vpc_error = create_vpc(ec2, config["CIDR_BLOCK"], config["TAG_VPC_NAME"], config["TAG_ENV"])
 
         if create_vpc_error:
-            print(f"Error: {create_vpc_error}")  # Handle error if VPC creation fails
+            logger.error("Error: %s", create_vpc_error)  # Handle error if VPC creation fails
         else:
-            # Print details of the newly created VPC
-            print(f"VPC Details:\n  VPC ID: {vpc_id}\n  Name: {config['TAG_VPC_NAME']}")
+            # Log details of the newly created VPC
+            logger.info("VPC Details:\n  VPC ID: %s\n  Name: %s", vpc_id, config['TAG_VPC_NAME'])
 
         # Enable DNS support and hostname lookups for the created VPC
         enable_dns_vpc(ec2, vpc_id)
 
 def create_subnet_operation() -> None:
     """Creates subnets based on the configuration."""
-    for cidr, az, tag in zip(config["CIDR_PUBLIC_SUBNETS"], config["AVAILABILITY_ZONES"], config["TAG_SUBNETS"]):
-        subnet_id, error = create_subnet(ec2, cidr, az, tag, config['TAG_ENV'])  # Create the subnet
+    vpc_id, vpc_error = get_vpc_id(ec2)  # Resolve the VPC once for all subnets
+    if vpc_error:
+        logger.error("Error: %s", vpc_error)
+        return
+
+    # The per-AZ subnets are independent, so create them concurrently instead
+    # of paying one round trip after another; results stay in config order
+    specs = list(zip(config["CIDR_PUBLIC_SUBNETS"], config["AVAILABILITY_ZONES"], config["TAG_SUBNETS"]))
+    with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+        results = list(executor.map(
+            lambda spec: create_subnet(ec2, spec[0], spec[1], spec[2], config['TAG_ENV'], vpc_id),
+            specs
+        ))
+
+    for subnet_id, error in results:
         if error:
-            print(f"{error}")  # Handle the error if occurred
+            logger.error("%s", error)  # Handle the error if occurred
         else:
-            print(f"Created Subnet ID: {subnet_id}")  # Print the created subnet ID
+            logger.info("Created Subnet ID: %s", subnet_id)  # Log the created subnet ID
 
 def create_route_table_operation() -> None:
     """Creates a route table if it does not already exist."""
     vpc_id = get_vpc_id(ec2)  # Get the VPC ID
 
     if route_table_exists(ec2, config["TAG_RTB"], config["TAG_ENV"], vpc_id[0]):
-        print(
-            f"RouteTable Exits:\n"
-            f"    Name: {config['TAG_RTB']}\n"
-            f"    Environment: {config['TAG_ENV']}\n"
-            f"    VPC: {vpc_id}")
+        logger.info(
+            "RouteTable Exits:\n    Name: %s\n    Environment: %s\n    VPC: %s",
+            config['TAG_RTB'], config['TAG_ENV'], vpc_id)
     else:
         # Create a new route table if it does not exist
         rtb = ec2.create_route_table(
@@ -70,44 +115,43 @@ def create_route_table_operation() -> None:
                         {
                             'Key': 'Name',  # Key for the Name tag
                             'Value': config['TAG_RTB']  # Value for the Name tag
-                        },
-                        {
-                            'Key': 'Environment',  # Key for the Environment tag
-                            'Value': config['TAG_ENV']  # Value for the Environment tag
                         }
+                        # The Environment tag is injected by _add_default_tags
                     ]
                 }
             ],
             VpcId=vpc_id[0]  # ID of the VPC to create the route table in
         )
-        # Print details of the created route table
-        print(
-            f"RouteTable Created:\n"
-            f"    RouteTable ID: {rtb['RouteTable']['RouteTableId']}\n"
-            f"    Name: {rtb['RouteTable']['Tags'][0]['Value']}")
+        clear_describe_cache()  # Cached lookups no longer reflect the new route table
+        # Log details of the created route table
+        logger.info(
+            "RouteTable Created:\n    RouteTable ID: %s\n    Name: %s",
+            rtb['RouteTable']['RouteTableId'], rtb['RouteTable']['Tags'][0]['Value'])
 
 def associate_subnets_operation() -> None:
     """Associates subnets with the route table."""
     try:
-        rtb_id = get_route_table_id(ec2, config['TAG_RTB'])
-        if "Error" in rtb_id:
-            print(f"Error: {rtb_id}")
+        try:
+            rtb_id = get_route_table_id(ec2, config['TAG_RTB'], config['TAG_ENV'])
+        except (ResourceNotFound, AWSOpError) as e:
+            logger.error("Error: %s", e)
             return
 
-        subnet_details, subnet_ids = get_subnet_info(ec2, config['TAG_SUBNET'])
+        subnet_details, subnet_ids = get_subnet_info(ec2, config['TAG_SUBNET'], config['TAG_ENV'])
         if isinstance(subnet_ids, str):  # Check if it's an error message
-            print(f"Error: {subnet_ids}")
+            logger.error("Error: %s", subnet_ids)
             return
 
         if not subnet_ids:
-            print("Error: No subnets found with the specified tag.")
+            logger.error("Error: No subnets found with the specified tag.")
         else:
-            # Print details of each found subnet
+            # Log details of each found subnet
             for subnet_id in subnet_ids:
                 details = subnet_details[subnet_id]
-                print(f"Subnet Found:\n  Subnet ID: {subnet_id}\n  CIDR Block: {details['CIDR Block']}\n  Availability Zone: {details['Availability Zone']}\n  VPC ID: {details['VPC ID']}")
+                logger.info("Subnet Found:\n  Subnet ID: %s\n  CIDR Block: %s\n  Availability Zone: %s\n  VPC ID: %s",
+                            subnet_id, details['CIDR Block'], details['Availability Zone'], details['VPC ID'])
 
-            print("Subnet IDs:", subnet_ids)
+            logger.info("Subnet IDs: %s", subnet_ids)
 
             # Associate the route table with the subnets
             response = associate_route_table(ec2, subnet_ids, rtb_id)
@@ -115,144 +159,293 @@ def associate_subnets_operation() -> None:
             # Print results of the association
             for subnet, result in response:
                 if isinstance(result, dict):
-                    print(f"Successfully associated RouteTable {rtb_id} with Subnet {subnet}.")
+                    logger.info("Successfully associated RouteTable %s with Subnet %s.", rtb_id, subnet)
                 else:
-                    print(f"Error: Failed to associate RouteTable {rtb_id} with Subnet {subnet}. Error: {result}")
+                    logger.error("Error: Failed to associate RouteTable %s with Subnet %s. Error: %s", rtb_id, subnet, result)
     except Exception as e:
-        print(f"Error: An error occurred in the main execution: {str(e)}")
+        logger.error("Error: An error occurred in the main execution: %s", e)
 
 def create_internet_gateway_operation() -> None:
     """Creates an Internet Gateway if it does not already exist."""
     exists = internet_gateway_exists(ec2, config['TAG_IGW_NAME'], config['TAG_ENV'])
 
     if exists:
-        print(f"Internet Gateway with name '{config['TAG_IGW_NAME']}' for environment '{config['TAG_ENV']}' already exists.")
+        logger.info("Internet Gateway with name '%s' for environment '%s' already exists.", config['TAG_IGW_NAME'], config['TAG_ENV'])
         return  # Exit if the Internet Gateway already exists
 
     create_igw = create_internet_gateway(ec2)
     if 'Error' in create_igw:
-        print(f"Error: {create_igw}")
+        logger.error("Error: %s", create_igw)
     else:
-        print(f"Internet Gateway created with ID: {create_igw}")
+        logger.info("Internet Gateway created with ID: %s", create_igw)
 
 def attach_internet_gateway_operation() -> None:
     """Attaches the Internet Gateway to the VPC."""
     vpc_id, error = get_vpc_id(ec2)
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
-    igw_id, error = get_internet_gateway_id(ec2, config['TAG_IGW_NAME'])
+    igw_id, error = get_internet_gateway_id(ec2, config['TAG_IGW_NAME'], config['TAG_ENV'])
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
     success, response_or_error = attach_internet_gateway(ec2, vpc_id, igw_id)
     if not success:
-        print(f"Error: {response_or_error}")  # Handle the error if attachment fails
+        logger.error("Error: %s", response_or_error)  # Handle the error if attachment fails
     else:
-        print(f"Internet Gateway successfully attached to VPC: {vpc_id}.")
+        logger.info("Internet Gateway successfully attached to VPC: %s.", vpc_id)
 
 def create_route_operation() -> None:
     """Creates a route in the Route Table to direct traffic to the Internet Gateway."""
-    igw_id, error = get_internet_gateway_id(ec2, config['TAG_IGW_NAME'])
+    igw_id, error = get_internet_gateway_id(ec2, config['TAG_IGW_NAME'], config['TAG_ENV'])
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
-    rtb_id = get_route_table_id(ec2, config['TAG_RTB'])
-    if isinstance(rtb_id, str) and "No route table found" in rtb_id:
-        print(f"Error: {rtb_id}")
+    try:
+        rtb_id = get_route_table_id(ec2, config['TAG_RTB'], config['TAG_ENV'])
+    except (ResourceNotFound, AWSOpError) as e:
+        logger.error("Error: %s", e)
         return
 
     route_result = create_route(ec2, config['DEST_CIDR_BLOCK'], igw_id, rtb_id)
     if isinstance(route_result, tuple) and route_result[1]:
-        print(f"Error: {route_result[1]}")  # Print error if route creation fails
+        logger.error("Error: %s", route_result[1])  # Log error if route creation fails
     else:
-        print(f"Route created successfully in RouteTable ID: {route_result[0]}")
+        logger.info("Route created successfully in RouteTable ID: %s", route_result[0])
 
 def delete_route_operation() -> None:
     """Handles the route deletion operation."""
-    route_table_id = get_route_table_id(ec2, config["TAG_RTB"])
-    if isinstance(route_table_id, str) and "No route table found" in route_table_id:
-        print(f"Error: {route_table_id}")
+    try:
+        route_table_id = get_route_table_id(ec2, config["TAG_RTB"], config["TAG_ENV"])
+    except (ResourceNotFound, AWSOpError) as e:
+        logger.error("Error: %s", e)
+        return
+
+    ok, payload = delete_route(ec2, route_table_id, config["DEST_CIDR_BLOCK"])
+    if ok:
+        # Formatting happens in the listener, only when the record is emitted
+        logger.info("Route deleted successfully from Route Table %s for CIDR block %s",
+                    payload['route_table_id'], payload['dest_cidr_block'])
     else:
-        result = delete_route(ec2, route_table_id, config["DEST_CIDR_BLOCK"])
-        print(result)
+        logger.error("Error: %s", payload['error'])
 
 def delete_route_table_operation() -> None:
     """Handles the deletion of the route table."""
-    route_table_id = get_route_table_id(ec2, config["TAG_RTB"])
-    if 'No route table found' in route_table_id or 'error' in route_table_id.lower():
-        print(f"Error: {route_table_id}")
+    try:
+        route_table_id = get_route_table_id(ec2, config["TAG_RTB"], config["TAG_ENV"])
+    except (ResourceNotFound, AWSOpError) as e:
+        logger.error("Error: %s", e)
+        return
+
+    ok, payload = delete_route_table(ec2, route_table_id)
+    if ok:
+        logger.info("Route Table %s deleted successfully.", payload['route_table_id'])
     else:
-        result = delete_route_table(ec2, route_table_id)
-        print(result)
+        logger.error("Error: %s", payload['error'])
 
 def detach_internet_gateway_operation() -> None:
     """Handles the Internet Gateway detachment operation."""
     vpc_id, error = get_vpc_id(ec2)
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
-    igw_id, error = get_internet_gateway_id(ec2, config["TAG_IGW_NAME"])
+    igw_id, error = get_internet_gateway_id(ec2, config["TAG_IGW_NAME"], config["TAG_ENV"])
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
-    result = detach_internet_gateway(ec2, igw_id, vpc_id)
-    print(result)
+    ok, payload = detach_internet_gateway(ec2, igw_id, vpc_id)
+    if ok:
+        logger.info("Internet Gateway %s detached from VPC %s successfully.", payload['igw_id'], payload['vpc_id'])
+    else:
+        logger.error("Error: %s", payload['error'])
 
 def delete_internet_gateway_operation() -> None:
     """Handles the Internet Gateway deletion operation."""
-    igw_id, error = get_internet_gateway_id(ec2, config["TAG_IGW_NAME"])
+    igw_id, error = get_internet_gateway_id(ec2, config["TAG_IGW_NAME"], config["TAG_ENV"])
     if error:
-        print(f"Error: {error}")
+        logger.error("Error: %s", error)
         return
 
     result = delete_internet_gateway(ec2, igw_id)
-    print(result)
+    logger.info("%s", result)
 
 def disassociate_subnets_operation() -> None:
     """Handles the disassociation of subnets from the route table."""
-    result = disassociate_subnets_from_route_table(ec2, config["TAG_RTB"])
-    print(result)
+    ok, payload = disassociate_subnets_from_route_table(ec2, config["TAG_RTB"])
+    if not ok:
+        logger.error("Error: %s", payload['error'])
+    elif payload['removed_subnets']:
+        logger.info("Successfully disassociated %d subnet(s) from route table %s. \nRemoved subnets: %s.",
+                    len(payload['removed_subnets']), payload['route_table_id'], ', '.join(payload['removed_subnets']))
+    else:
+        logger.info("No non-main subnets found associated with route table %s.", payload['route_table_id'])
 
 def delete_subnets_operation() -> None:
     """Handles the deletion of subnets."""
-    subnet_details, subnet_ids = get_subnet_info(ec2, config["TAG_SUBNET"])
-    if subnet_ids:
-        for subnet_id in subnet_ids:
-            print(f"Subnet ID: {subnet_id}, Details: {subnet_details.get(subnet_id, {})}")
-    else:
-        print("Error: No subnets found or an error occurred.")
+    subnet_details, subnet_ids = get_subnet_info(ec2, config["TAG_SUBNET"], config["TAG_ENV"])
+    if not subnet_ids:
+        logger.error("Error: No subnets found or an error occurred.")
+        return
 
     for subnet_id in subnet_ids:
-        try:
-            response = ec2.delete_subnet(SubnetId=subnet_id)
-            print(f"Deleted Subnet ID: {subnet_id}")
-        except ClientError as e:
-            print(f"Error: Failed to delete Subnet ID: {subnet_id}, Error: {e.response['Error']['Message']}")
-        except Exception as e:
-            print(f"Error: Failed to delete Subnet ID: {subnet_id}, Error: {str(e)}")
+        logger.info("Subnet ID: %s, Details: %s", subnet_id, subnet_details.get(subnet_id, {}))
+
+    # The deletions are independent, so dispatch them concurrently and report
+    # each result as it completes instead of waiting on one response at a time
+    with ThreadPoolExecutor(max_workers=min(10, len(subnet_ids))) as executor:
+        futures = {executor.submit(ec2.delete_subnet, SubnetId=subnet_id): subnet_id
+                   for subnet_id in subnet_ids}
+        for future in as_completed(futures):
+            subnet_id = futures[future]
+            try:
+                future.result()
+                logger.info("Deleted Subnet ID: %s", subnet_id)
+            except ClientError as e:
+                logger.error("Error: Failed to delete Subnet ID: %s, Error: %s", subnet_id, e.response['Error']['Message'])
+
+    clear_describe_cache()  # Cached subnet lookups are stale after the deletions
 
 def delete_vpc_operation() -> None:
     """Handles the deletion of the VPC."""
     vpc_id, error_message = get_vpc_id(ec2)
     if error_message:
-        print(f"Error: {error_message}")
+        logger.error("Error: %s", error_message)
     elif vpc_id:
         delete_status = delete_vpc(ec2, vpc_id)
         if isinstance(delete_status, int):
-            print(f"VPC {vpc_id} deleted successfully with status code: {delete_status}")
+            logger.info("VPC %s deleted successfully with status code: %s", vpc_id, delete_status)
         else:
-            print(f"Error: {delete_status}")
+            logger.error("Error: %s", delete_status)
     else:
-        print("Error: No VPC to delete.")
+        logger.error("Error: No VPC to delete.")
+
+def build_stack_template() -> str:
+    """Builds the CloudFormation template for the whole VPC environment from config."""
+    resource_tags = [
+        {'Key': 'Name', 'Value': config['TAG_VPC_NAME']},
+        {'Key': 'Environment', 'Value': config['TAG_ENV']}
+    ]
+    resources = {
+        'Vpc': {
+            'Type': 'AWS::EC2::VPC',
+            'Properties': {
+                'CidrBlock': config['CIDR_BLOCK'],
+                'EnableDnsSupport': True,
+                'EnableDnsHostnames': True,
+                'Tags': resource_tags
+            }
+        },
+        'InternetGateway': {
+            'Type': 'AWS::EC2::InternetGateway',
+            'Properties': {
+                'Tags': [
+                    {'Key': 'Name', 'Value': config['TAG_IGW_NAME']},
+                    {'Key': 'Environment', 'Value': config['TAG_ENV']}
+                ]
+            }
+        },
+        'GatewayAttachment': {
+            'Type': 'AWS::EC2::VPCGatewayAttachment',
+            'Properties': {
+                'VpcId': {'Ref': 'Vpc'},
+                'InternetGatewayId': {'Ref': 'InternetGateway'}
+            }
+        },
+        'RouteTable': {
+            'Type': 'AWS::EC2::RouteTable',
+            'Properties': {
+                'VpcId': {'Ref': 'Vpc'},
+                'Tags': [
+                    {'Key': 'Name', 'Value': config['TAG_RTB']},
+                    {'Key': 'Environment', 'Value': config['TAG_ENV']}
+                ]
+            }
+        },
+        'DefaultRoute': {
+            'Type': 'AWS::EC2::Route',
+            'DependsOn': 'GatewayAttachment',
+            'Properties': {
+                'RouteTableId': {'Ref': 'RouteTable'},
+                'DestinationCidrBlock': config['DEST_CIDR_BLOCK'],
+                'GatewayId': {'Ref': 'InternetGateway'}
+            }
+        }
+    }
+
+    # One subnet plus route-table association per configured AZ
+    for index, (cidr, az, tag) in enumerate(
+            zip(config['CIDR_PUBLIC_SUBNETS'], config['AVAILABILITY_ZONES'], config['TAG_SUBNETS']), start=1):
+        resources[f'Subnet{index}'] = {
+            'Type': 'AWS::EC2::Subnet',
+            'Properties': {
+                'VpcId': {'Ref': 'Vpc'},
+                'CidrBlock': cidr,
+                'AvailabilityZone': az,
+                'Tags': [
+                    {'Key': 'Name', 'Value': tag},
+                    {'Key': 'Environment', 'Value': config['TAG_ENV']}
+                ]
+            }
+        }
+        resources[f'Subnet{index}Association'] = {
+            'Type': 'AWS::EC2::SubnetRouteTableAssociation',
+            'Properties': {
+                'SubnetId': {'Ref': f'Subnet{index}'},
+                'RouteTableId': {'Ref': 'RouteTable'}
+            }
+        }
+
+    return json.dumps({
+        'AWSTemplateFormatVersion': '2010-09-09',
+        'Description': f"AcmeLabs {config['TAG_ENV']} VPC environment",
+        'Resources': resources
+    })
+
+def create_stack_operation() -> None:
+    """Creates the whole environment as one CloudFormation stack instead of seven API calls."""
+    cfn = boto3.client('cloudformation')
+    stack_name = f"vpc-{config['TAG_ENV'].lower()}"
+    try:
+        # CloudFormation orders and parallelizes the resource creation
+        # server-side, so the client pays a single create round trip
+        cfn.create_stack(
+            StackName=stack_name,
+            TemplateBody=build_stack_template()
+        )
+        logger.info("Stack creation started: %s", stack_name)
+        cfn.get_waiter('stack_create_complete').wait(StackName=stack_name)
+        logger.info("Stack created successfully: %s", stack_name)
+    except ClientError as e:
+        logger.error("Error: Failed to create stack %s: %s", stack_name, e.response['Error']['Message'])
+
+def delete_stack_operation() -> None:
+    """Deletes the CloudFormation stack and everything it created."""
+    cfn = boto3.client('cloudformation')
+    stack_name = f"vpc-{config['TAG_ENV'].lower()}"
+    try:
+        cfn.delete_stack(StackName=stack_name)
+        logger.info("Stack deletion started: %s", stack_name)
+        cfn.get_waiter('stack_delete_complete').wait(StackName=stack_name)
+        logger.info("Stack deleted successfully: %s", stack_name)
+    except ClientError as e:
+        logger.error("Error: Failed to delete stack %s: %s", stack_name, e.response['Error']['Message'])
 
 def main():
-    operation = input("Do you want to create or delete resources? (create/delete): ").strip().lower()
+    operation = input("Do you want to create or delete resources? (create/delete/stack/delete-stack): ").strip().lower()
+
+    if operation == "stack":
+        create_stack_operation()  # Single fused deployment; no per-resource calls needed
+        return
+    elif operation == "delete-stack":
+        delete_stack_operation()
+        return
+
+    prime_resource_cache()  # One tag sweep replaces the per-operation ID lookups
 
     if operation == "create":
         # Execute the operations to create the VPC and its associated resources
@@ -275,7 +468,7 @@ def main():
         delete_vpc_operation()              # Step 7: Delete the VPC
 
     else:
-        print("Invalid operation. Please specify 'create' or 'delete'.")
+        logger.error("Invalid operation. Please specify 'create' or 'delete'.")
 
 if __name__ == "__main__":
     main()
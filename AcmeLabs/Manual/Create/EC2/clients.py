@@ -0,0 +1,32 @@
+import os
+
+# These scripts run from workstations with static credentials, so skip the
+# EC2 metadata probe that can stall the credential chain for seconds when
+# off-EC2. setdefault keeps any explicit operator override in effect.
+os.environ.setdefault('AWS_EC2_METADATA_DISABLED', 'true')
+
+import boto3
+from botocore.config import Config
+import functools
+
+@functools.lru_cache(maxsize=1)
+def get_ec2_client() -> boto3.client:
+    """
+    Return the shared EC2 client, building it on first use.
+
+    Every script in this directory previously constructed its own client at
+    import time, re-running botocore's endpoint resolution, credential chain
+    and TLS setup per process. The cached factory builds one client with a
+    pool large enough for the concurrent calls the scripts issue.
+
+    Returns:
+        boto3.client: The shared EC2 client.
+    """
+    return boto3.session.Session().client(
+        'ec2',
+        config=Config(
+            max_pool_connections=50,  # Concurrent calls reuse pooled connections
+            tcp_keepalive=True,  # Keep the warm connection from idling out
+            retries={'max_attempts': 10, 'mode': 'adaptive'}
+        )
+    )
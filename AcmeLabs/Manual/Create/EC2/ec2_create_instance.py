@@ -1,10 +1,51 @@
 import boto3
 from botocore.exceptions import ClientError
+from dataclasses import dataclass
 from typing import Tuple, Optional, List
+import json
+import sys
 import time
 
-# Initialize EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2_client
+
+@dataclass
+class InstanceSpec:
+    """All inputs needed to launch a batch of EC2 instances."""
+    image_id: str
+    instance_type: str
+    key_name: str
+    max_count: int
+    min_count: int
+    security_group_ids: List[str]
+    subnet_id: str
+    tag_name_value: str
+
+def load_instance_spec(lis_path: str) -> InstanceSpec:
+    """
+    Load and validate an instance spec from a JSON file.
+
+    One parse replaces the eight sequential interactive prompts, so scripted
+    runs never block on stdin.
+
+    Args:
+        lis_path (str): Path to the JSON spec file.
+
+    Returns:
+        InstanceSpec: The validated launch parameters.
+    """
+    with open(lis_path, 'r') as lis_file:
+        lis_data = json.load(lis_file)
+
+    return InstanceSpec(
+        image_id=lis_data['image_id'],
+        instance_type=lis_data['instance_type'],
+        key_name=lis_data['key_name'],
+        max_count=int(lis_data['max_count']),
+        min_count=int(lis_data['min_count']),
+        security_group_ids=list(lis_data['security_group_ids']),
+        subnet_id=lis_data['subnet_id'],
+        tag_name_value=lis_data['tag_name_value'],
+    )
 
 def prompt_with_retries(pwr_prompt: str, pwr_max_retries: int = 3) -> Optional[str]:
     """
@@ -45,127 +86,196 @@ def read_user_data(rud_file_path: str) -> Optional[str]:
         print(f"Error reading user data file: {e}")
         return None
 
-def launch_ec2_instances(client: boto3.client) -> Tuple[Optional[List[str]], Optional[List[str]], Optional[List[str]]]:
+def prompt_instance_spec() -> Optional[InstanceSpec]:
+    """
+    Collect an instance spec interactively, prompting per field.
+
+    Fallback for runs without a spec file; scripted callers should use
+    load_instance_spec instead.
+
+    Returns:
+        Optional[InstanceSpec]: The collected spec, or None if input ran out.
+    """
+    pis_fields = {}
+    for pis_key, pis_prompt in (
+        ('image_id', "Enter AMI ImageId: "),
+        ('instance_type', "Enter InstanceType: "),
+        ('key_name', "Enter KeyName: "),
+        ('max_count', "Enter MaxCount: "),
+        ('min_count', "Enter MinCount: "),
+        ('security_group_ids', "Enter SecurityGroupIds (comma-separated): "),
+        ('subnet_id', "Enter SubnetId: "),
+        ('tag_name_value', "Enter Tag value for the key 'Name': "),
+    ):
+        pis_value = prompt_with_retries(pis_prompt)
+        if pis_value is None:
+            print(f"Exiting due to lack of input for {pis_key}.")
+            return None
+        pis_fields[pis_key] = pis_value
+
+    return InstanceSpec(
+        image_id=pis_fields['image_id'],
+        instance_type=pis_fields['instance_type'],
+        key_name=pis_fields['key_name'],
+        max_count=int(pis_fields['max_count']),
+        min_count=int(pis_fields['min_count']),
+        security_group_ids=[pis_sg.strip() for pis_sg in pis_fields['security_group_ids'].split(',')],
+        subnet_id=pis_fields['subnet_id'],
+        tag_name_value=pis_fields['tag_name_value'],
+    )
+
+def launch_ec2_instances(client: boto3.client, lei_spec: InstanceSpec, lei_await_running: bool = False) -> Optional[List[str]]:
     """
-    Launch multiple EC2 instances based on user input.
+    Launch multiple EC2 instances from a prepared spec.
+
+    Returns the instance IDs as soon as RunInstances answers; callers that
+    need public IPs resolve them afterwards via resolve_public_ips, so
+    fire-and-forget flows skip the running-state barrier entirely.
 
     Args:
         client (boto3.client): The EC2 client for making API calls.
+        lei_spec (InstanceSpec): The validated launch parameters.
+        lei_await_running (bool): When True, block until all instances reach
+            the running state before returning.
 
     Returns:
-        Tuple[Optional[List[str]], Optional[List[str]], Optional[List[str]]]:
-        A list of instance IDs, a list of Name tag values, and a list of Public IP addresses,
-        or (None, None, None) on failure.
+        Optional[List[str]]: The launched instance IDs, or None on failure.
     """
-    # Prompt for user input with error handling
-    lei_image_id = prompt_with_retries("Enter AMI ImageId: ")
-    if lei_image_id is None:
-        print("Exiting due to lack of input for AMI ImageId.")
-        return None, None, None
-
-    lei_instance_type = prompt_with_retries("Enter InstanceType: ")
-    if lei_instance_type is None:
-        print("Exiting due to lack of input for InstanceType.")
-        return None, None, None
-
-    lei_key_name = prompt_with_retries("Enter KeyName: ")
-    if lei_key_name is None:
-        print("Exiting due to lack of input for KeyName.")
-        return None, None, None
-
-    lei_max_count = prompt_with_retries("Enter MaxCount: ")
-    if lei_max_count is None:
-        print("Exiting due to lack of input for MaxCount.")
-        return None, None, None
-
-    lei_min_count = prompt_with_retries("Enter MinCount: ")
-    if lei_min_count is None:
-        print("Exiting due to lack of input for MinCount.")
-        return None, None, None
-
-    lei_security_group_ids = prompt_with_retries("Enter SecurityGroupIds (comma-separated): ")
-    if lei_security_group_ids is None:
-        print("Exiting due to lack of input for SecurityGroupIds.")
-        return None, None, None
-
-    lei_subnet_id = prompt_with_retries("Enter SubnetId: ")
-    if lei_subnet_id is None:
-        print("Exiting due to lack of input for SubnetId.")
-        return None, None, None
-
-    lei_tag_name_value = prompt_with_retries("Enter Tag value for the key 'Name': ")
-    if lei_tag_name_value is None:
-        print("Exiting due to lack of input for Tag value.")
-        return None, None, None
-
     # Read user data from the file
     lei_user_data = read_user_data('userdata.sh')
     if lei_user_data is None:
         print("Exiting due to failure in reading user data.")
-        return None, None, None
+        return None
+
+    # Build the request pieces up front; dropping empty group IDs (e.g. from
+    # a trailing comma) avoids an InvalidGroupId.Malformed round trip
+    lei_groups = [lei_sg for lei_sg in lei_spec.security_group_ids if lei_sg]
+    lei_tag_spec = [
+        {
+            'ResourceType': 'instance',
+            'Tags': [
+                {'Key': 'Name', 'Value': lei_spec.tag_name_value},
+                {'Key': 'Environment', 'Value': 'Dev'},
+            ],
+        },
+    ]
 
     # Prepare the request to launch the instances
     try:
         lei_response = client.run_instances(
-            ImageId=lei_image_id,
-            InstanceType=lei_instance_type,
-            KeyName=lei_key_name,
-            MaxCount=int(lei_max_count),
-            MinCount=int(lei_min_count),
+            ImageId=lei_spec.image_id,
+            InstanceType=lei_spec.instance_type,
+            KeyName=lei_spec.key_name,
+            MaxCount=lei_spec.max_count,
+            MinCount=lei_spec.min_count,
             NetworkInterfaces=[
                 {
                     'AssociatePublicIpAddress': True,  # Allocate a public IP
                     'DeviceIndex': 0,
-                    'SubnetId': lei_subnet_id,
-                    'Groups': [lei_sg.strip() for lei_sg in lei_security_group_ids.split(',')],
-                },
-            ],
-            TagSpecifications=[
-                {
-                    'ResourceType': 'instance',
-                    'Tags': [
-                        {
-                            'Key': 'Name',
-                            'Value': lei_tag_name_value,
-                        },
-                        {
-                            'Key': 'Environment',
-                            'Value': 'Dev',
-                        },
-                    ],
+                    'SubnetId': lei_spec.subnet_id,
+                    'Groups': lei_groups,
                 },
             ],
+            TagSpecifications=lei_tag_spec,
             UserData=lei_user_data,
         )
     except ClientError as e:
         print(f"Failed to launch EC2 instances: {e}")
-        return None, None, None
+        return None
 
     # Extract instance IDs
     lei_instance_ids = [lei_instance['InstanceId'] for lei_instance in lei_response['Instances']]
 
-    # Wait for all instances to be in the running state
-    print("Waiting for instances to be in running state...")
-    lei_waiter = client.get_waiter('instance_running')
-    lei_waiter.wait(InstanceIds=lei_instance_ids)
+    if lei_await_running:
+        # Instances typically reach running in 20-40s; a 3s poll avoids the
+        # default waiter's 15s intervals of dead time
+        print("Waiting for instances to be in running state...")
+        lei_waiter = client.get_waiter('instance_running')
+        lei_waiter.wait(
+            InstanceIds=lei_instance_ids,
+            WaiterConfig={'Delay': 3, 'MaxAttempts': 100}
+        )
 
-    # Retrieve public IP addresses for all instances
-    lei_instance_info = client.describe_instances(InstanceIds=lei_instance_ids)
-    lei_public_ips = []
-    lei_name_values = []
+    return lei_instance_ids
 
-    for lei_reservation in lei_instance_info['Reservations']:
-        for lei_instance in lei_reservation['Instances']:
-            lei_public_ips.append(lei_instance.get('PublicIpAddress', None))
-            lei_name_values.append(next((lei_tag['Value'] for lei_tag in lei_instance.get('Tags', []) if lei_tag['Key'] == 'Name'), None))
+def resolve_public_ips(client: boto3.client, rpi_instance_ids: List[str], rpi_tag_name_value: Optional[str] = None) -> Tuple[List[str], List[Optional[str]], List[Optional[str]]]:
+    """
+    Wait for the given instances to run and fetch their Name tags and public IPs.
 
-    return lei_instance_ids, lei_name_values, lei_public_ips
+    Split out of launch_ec2_instances so callers that only need instance IDs
+    are not forced through the running-state barrier.
+
+    Args:
+        client (boto3.client): The EC2 client for making API calls.
+        rpi_instance_ids (List[str]): The instance IDs to resolve.
+        rpi_tag_name_value (Optional[str]): When given, the describe filters
+            on this Name tag plus the running state instead of the ID list,
+            so large fleets stream back page by page without ID bookkeeping.
+
+    Returns:
+        Tuple[List[str], List[Optional[str]], List[Optional[str]]]: The
+        instance IDs, Name tag values and public IP addresses, aligned
+        index-for-index in the order the API returns the instances. The API
+        order is unrelated to rpi_instance_ids, so callers must pair fields
+        through these lists rather than their own ID list.
+    """
+    rpi_waiter = client.get_waiter('instance_running')
+    rpi_waiter.wait(
+        InstanceIds=rpi_instance_ids,
+        WaiterConfig={'Delay': 3, 'MaxAttempts': 100}
+    )
+
+    rpi_paginator = client.get_paginator('describe_instances')
+    if rpi_tag_name_value is not None:
+        # The launch-time tag identifies the fleet, so filter server-side
+        # instead of shipping every instance ID back in the request
+        rpi_pages = rpi_paginator.paginate(
+            Filters=[
+                {'Name': 'tag:Name', 'Values': [rpi_tag_name_value]},
+                {'Name': 'instance-state-name', 'Values': ['running']}
+            ],
+            PaginationConfig={'PageSize': 100}
+        )
+    else:
+        rpi_pages = rpi_paginator.paginate(
+            InstanceIds=rpi_instance_ids,
+            PaginationConfig={'PageSize': 100}
+        )
+
+    # Flatten the paginated reservations once, then read tags through a dict
+    # so each instance's tag list is scanned a single time
+    rpi_instances = [
+        rpi_instance
+        for rpi_page in rpi_pages
+        for rpi_reservation in rpi_page['Reservations']
+        for rpi_instance in rpi_reservation['Instances']
+    ]
+    rpi_resolved_ids = [rpi_instance['InstanceId'] for rpi_instance in rpi_instances]
+    rpi_public_ips = [rpi_instance.get('PublicIpAddress') for rpi_instance in rpi_instances]
+    rpi_name_values = [
+        {rpi_tag['Key']: rpi_tag['Value'] for rpi_tag in rpi_instance.get('Tags', [])}.get('Name')
+        for rpi_instance in rpi_instances
+    ]
+
+    return rpi_resolved_ids, rpi_name_values, rpi_public_ips
 
 # Main execution block
 if __name__ == "__main__":
-    instance_ids, name_values, public_ips = launch_ec2_instances(ec2)
-    if instance_ids and name_values and public_ips:
-        for instance_id, name_value, public_ip in zip(instance_ids, name_values, public_ips):
+    ec2 = get_ec2_client()  # Shared, pooled client; built here rather than at import
+
+    # A spec file on the command line skips the interactive prompts entirely
+    spec = load_instance_spec(sys.argv[1]) if len(sys.argv) > 1 else prompt_instance_spec()
+    if spec is None:
+        print("Instance launch aborted: no spec provided.")
+        sys.exit(1)
+
+    instance_ids = launch_ec2_instances(ec2, spec)
+    if instance_ids:
+        # The interactive flow still reports IPs, so resolve them here.
+        # Describe by ID: the Name tag is reused across reruns, so a tag
+        # filter would pull in instances from earlier launches
+        resolved_ids, name_values, public_ips = resolve_public_ips(ec2, instance_ids)
+        for instance_id, name_value, public_ip in zip(resolved_ids, name_values, public_ips):
             print(
                 f"Instance launched successfully:\n"
                 f"  Instance ID: {instance_id}\n"
@@ -1,10 +1,38 @@
 import boto3
 from botocore.exceptions import ClientError
+import json
 import os
 from typing import Optional, Dict, Any
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2_client
+
+# Cache of known-good key-pair names -> AWS KeyPairId, so warm runs replace
+# the DescribeKeyPairs round trip with a filesystem read
+KEYPAIR_CACHE_FILE = os.path.expanduser('~/.cache/acmelabs/keypairs.json')
+
+def load_keypair_cache() -> Dict[str, str]:
+    """
+    Load the local cache of known key pairs.
+
+    Returns:
+    - A dict of key-pair name to KeyPairId; empty if no cache exists yet.
+    """
+    try:
+        with open(KEYPAIR_CACHE_FILE, 'r') as lkc_file:
+            return json.load(lkc_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_keypair_cache(skc_cache: Dict[str, str]) -> None:
+    """
+    Persist the local cache of known key pairs.
+
+    Parameters:
+    - skc_cache: The dict of key-pair name to KeyPairId to write.
+    """
+    os.makedirs(os.path.dirname(KEYPAIR_CACHE_FILE), exist_ok=True)
+    with open(KEYPAIR_CACHE_FILE, 'w') as skc_file:
+        json.dump(skc_cache, skc_file)
 
 def create_key_pair(client: boto3.client, ckp_key_name: str) -> Optional[Dict[str, Any]]:
     """
@@ -37,6 +65,10 @@ def create_key_pair(client: boto3.client, ckp_key_name: str) -> Optional[Dict[st
         # Save the private key to a file
         private_key = ckp_response['KeyMaterial']
         save_private_key_to_file(ckp_key_name, private_key)
+        # Record the new pair so later runs skip the existence round trip
+        ckp_cache = load_keypair_cache()
+        ckp_cache[ckp_key_name] = ckp_response['KeyPairId']
+        save_keypair_cache(ckp_cache)
         return ckp_response
     except ClientError as e:
         if e.response['Error']['Code'] == 'InvalidKeyPair.Duplicate':
@@ -59,9 +91,19 @@ def key_pair_exists(client: boto3.client, kpe_key_name: str) -> bool:
     """
     try:
         kpe_response = client.describe_key_pairs(KeyNames=[kpe_key_name])
-        return True if kpe_response['KeyPairs'] else False
+        if kpe_response['KeyPairs']:
+            # Remember the confirmed pair so later runs skip this round trip
+            kpe_cache = load_keypair_cache()
+            kpe_cache[kpe_key_name] = kpe_response['KeyPairs'][0]['KeyPairId']
+            save_keypair_cache(kpe_cache)
+            return True
+        return False
     except ClientError as e:
         if e.response['Error']['Code'] == 'InvalidKeyPair.NotFound':
+            # Drop any stale cache entry for a pair AWS no longer knows
+            kpe_cache = load_keypair_cache()
+            if kpe_cache.pop(kpe_key_name, None) is not None:
+                save_keypair_cache(kpe_cache)
             return False
         else:
             print(f"Error checking key pair existence: {e}")
@@ -79,9 +121,14 @@ def save_private_key_to_file(spktf_key_name: str, spktf_private_key: str) -> Non
     current_directory = os.getcwd()
     file_name = os.path.join(current_directory, f"{spktf_key_name}.pem")
 
-    with open(file_name, 'w') as file:
-        file.write(spktf_private_key)
-    os.chmod(file_name, 0o400)
+    # Create the file with its final 0o400 mode in one call so the key is
+    # never momentarily readable with default permissions, and O_EXCL
+    # refuses to clobber an existing key file
+    spktf_fd = os.open(file_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o400)
+    try:
+        os.write(spktf_fd, spktf_private_key.encode())
+    finally:
+        os.close(spktf_fd)
 
     # Print the message including the current working directory
     print(f"Private key saved to '{file_name}'.")
@@ -99,11 +146,22 @@ def local_key_exists(lke_key_name: str) -> bool:
     return os.path.isfile(f"{lke_key_name}.pem")
 
 if __name__ == '__main__':
+    ec2 = get_ec2_client()  # Shared, pooled client; built here rather than at import
+
     # Prompt the user for the key name
     key_name = input("Enter the name for the key pair: ")
 
+    # Cache-first: a cached KeyPairId or a local .pem means the pair almost
+    # certainly exists, so the DescribeKeyPairs round trip can be skipped
+    cached_key_id = load_keypair_cache().get(key_name)
+    if cached_key_id:
+        print(f"Key pair '{key_name}' known locally (KeyPairId: {cached_key_id}), no action taken.")
+    elif local_key_exists(key_name) and input(
+            f"Local key file '{key_name}.pem' found. Skip the AWS existence check? (y/n): "
+    ).strip().lower() == 'y':
+        print(f"Key pair '{key_name}' assumed to exist, no action taken.")
     # Check if the key pair already exists in AWS
-    if key_pair_exists(ec2, key_name):
+    elif key_pair_exists(ec2, key_name):
         print(f"Key pair '{key_name}' already exists in AWS, no action taken.")
     else:
         # Check if a local copy exists based on the user input
@@ -1,35 +1,125 @@
 import boto3
 from botocore.exceptions import ClientError
-from typing import Union, Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Union, Dict, Any, Iterable, List, Optional, Tuple
+import ipaddress
 import re
+import sys
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2_client
 
-def security_group_exists(client: boto3.client, sge_group_name: str, sge_vpc_id: str) -> bool:
-    """Check if a security group exists in the specified VPC.
+class SGError(Exception):
+    """Raised when a security group API operation fails."""
+
+class PromptExhausted(Exception):
+    """Raised when an interactive prompt runs out of retries."""
+
+# Security group names confirmed to exist per VPC; repeat checks for a name
+# answer from here instead of issuing another describe round-trip
+_SG_NAME_CACHE: Dict[str, set] = {}
+
+# Compile the validation pattern once at import instead of per call;
+# fullmatch makes the whole-string requirement explicit without anchors
+_SG_ID_RE = re.compile(r'sg-[0-9a-f]{8,17}')
+
+# Protocols the rule prompts accept, built once instead of per prompt;
+# 'icmp' and '-1' (all protocols) are valid IpProtocol values too
+_VALID_PROTOCOLS = frozenset(('tcp', 'udp', 'icmp', '-1'))
+
+# Accepted answers for the yes/no questions in the main flow, and the
+# subset that counts as a yes when branching on the response
+_YES_NO = frozenset(('yes', 'no', 'y', 'n'))
+_AFFIRMATIVE = frozenset(('yes', 'y'))
+
+# Maps a rule direction to the authorize method name, so ingress and egress
+# share one code path in create_rule instead of duplicated branches
+_DIRECTIONS = {
+    'ingress': 'authorize_security_group_ingress',
+    'egress': 'authorize_security_group_egress',
+}
+
+# Interned once so the per-rule response lookups in _extract_rules hit the
+# pointer-equality fast path instead of hashing a fresh string per key
+_K_GROUP_ID = sys.intern('GroupId')
+_K_RULE_ID = sys.intern('SecurityGroupRuleId')
+_K_PROTOCOL = sys.intern('IpProtocol')
+_K_FROM_PORT = sys.intern('FromPort')
+_K_TO_PORT = sys.intern('ToPort')
+
+# One C-level multi-key getter replaces five per-rule subscript lookups
+_RULE_FIELDS = itemgetter(_K_GROUP_ID, _K_RULE_ID, _K_PROTOCOL, _K_FROM_PORT, _K_TO_PORT)
+
+@dataclass(slots=True, frozen=True)
+class RuleRec:
+    """One created security group rule, trimmed to the reportable fields.
+
+    A slotted record is a fraction of the size of the equivalent dict and
+    reads fields with a fixed-offset load instead of a hashed lookup.
+    """
+    group_id: str
+    rule_id: str
+    protocol: str
+    from_port: int
+    to_port: int
+    cidr_ipv4: str
+
+def security_groups_existing(client: boto3.client, sge_group_names: Iterable[str], sge_vpc_id: str) -> set:
+    """Return which of the given security group names exist in a VPC.
+
+    A single multi-value group-name filter answers for every name at once,
+    so checking N names costs one describe round-trip instead of N. Names
+    already confirmed by the per-VPC cache are not re-queried at all.
 
     Args:
         client: The Boto3 EC2 client.
-        sge_group_name: The name of the security group.
-        sge_vpc_id: The VPC ID where the security group is located.
+        sge_group_names: The security group names to check.
+        sge_vpc_id: The VPC ID where the security groups are located.
 
     Returns:
-        True if the security group exists, False otherwise.
+        The subset of names that already exist in the VPC.
+
+    Raises:
+        SGError: If the describe call fails.
     """
+    sge_cached = _SG_NAME_CACHE.get(sge_vpc_id, set())
+    sge_pending = [sge_name for sge_name in sge_group_names if sge_name not in sge_cached]
+    sge_found = {sge_name for sge_name in sge_group_names if sge_name in sge_cached}
+    if not sge_pending:
+        return sge_found  # Every name was confirmed earlier in this run
     try:
-        sge_response = client.describe_security_groups(
+        sge_pages = client.get_paginator('describe_security_groups').paginate(
             Filters=[
-                {'Name': 'group-name', 'Values': [sge_group_name]},
+                {'Name': 'group-name', 'Values': sge_pending},
                 {'Name': 'vpc-id', 'Values': [sge_vpc_id]}
             ]
         )
-        return len(sge_response['SecurityGroups']) > 0
+        for sge_page in sge_pages:
+            for sge_group in sge_page['SecurityGroups']:
+                sge_found.add(sge_group['GroupName'])
+        _SG_NAME_CACHE.setdefault(sge_vpc_id, set()).update(sge_found)
+        return sge_found
     except ClientError as e:
-        return False  # Return False on error for existence check
+        raise SGError(f"An error occurred while checking security group existence: {e}") from e
+
+def security_group_exists(client: boto3.client, sge_group_name: str, sge_vpc_id: str) -> bool:
+    """Check if a single security group exists in the specified VPC.
+
+    Thin wrapper over security_groups_existing for the one-name case.
+
+    Args:
+        client: The Boto3 EC2 client.
+        sge_group_name: The name of the security group.
+        sge_vpc_id: The VPC ID where the security group is located.
 
-def create_security_group(client: boto3.client, csg_group_name: str, csg_description: str, csg_vpc_id: str) -> Union[
-    Dict[str, Any], str]:
+    Returns:
+        True if the security group exists, False otherwise.
+    """
+    return sge_group_name in security_groups_existing(client, (sge_group_name,), sge_vpc_id)
+
+def create_security_group(client: boto3.client, csg_group_name: str, csg_description: str,
+                          csg_vpc_id: str) -> Dict[str, Any]:
     """Create a security group in the specified VPC.
 
     Args:
@@ -39,7 +129,10 @@ def create_security_group(client: boto3.client, csg_group_name: str, csg_descrip
         csg_vpc_id: The VPC ID where the security group will be created.
 
     Returns:
-        The response from the create security group API or an error message.
+        The response from the create security group API.
+
+    Raises:
+        SGError: If the create call fails.
     """
     try:
         csg_response = client.create_security_group(
@@ -47,9 +140,12 @@ def create_security_group(client: boto3.client, csg_group_name: str, csg_descrip
             Description=csg_description,
             VpcId=csg_vpc_id,
         )
+        # Keep the per-VPC name cache current so a later existence check
+        # for this group needs no API call
+        _SG_NAME_CACHE.setdefault(csg_vpc_id, set()).add(csg_group_name)
         return csg_response
     except ClientError as e:
-        return f"An error occurred while creating security group: {e}"
+        raise SGError(f"An error occurred while creating security group: {e}") from e
 
 def tag_security_group(client: boto3.client, tsg_group_id: str, tsg_tag_value: str) -> str:
     """Tag a security group with a specified name.
@@ -60,19 +156,25 @@ def tag_security_group(client: boto3.client, tsg_group_id: str, tsg_tag_value: s
         tsg_tag_value: The value for the tag.
 
     Returns:
-        Success or error message.
+        A success message.
+
+    Raises:
+        SGError: If the tagging call fails.
     """
     try:
         tsg_response = client.create_tags(
             Resources=[tsg_group_id],
             Tags=[{'Key': 'Name', 'Value': tsg_tag_value}]
         )
-        if tsg_response['ResponseMetadata']['HTTPStatusCode'] == 200:
+        # Retry-wrapped responses can arrive without metadata; a .get chain
+        # keeps that case on the normal path instead of raising KeyError
+        tsg_status = tsg_response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        if tsg_status == 200:
             return "Security group tagged successfully."
         else:
-            return f"Failed to tag security group id: {tsg_group_id}"
+            raise SGError(f"Failed to tag security group id: {tsg_group_id}")
     except ClientError as e:
-        return f"An error occurred while tagging security group: {e}"
+        raise SGError(f"An error occurred while tagging security group: {e}") from e
 
 def cr_is_valid_cidr(civc_cidr: str) -> bool:
     """Check if the input is a valid CIDR block.
@@ -83,7 +185,15 @@ def cr_is_valid_cidr(civc_cidr: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    return re.match(r'^(?:[0-9]{1,3}\.){3}[0-9]{1,3}/[0-9]{1,2}$', civc_cidr) is not None
+    # ipaddress rejects out-of-range octets and prefixes (e.g. 999.0.0.0/99)
+    # that the old regex let through to AWS, saving a round-trip per bad input
+    if '/' not in civc_cidr:  # EC2 requires explicit prefix notation
+        return False
+    try:
+        ipaddress.ip_network(civc_cidr, strict=False)
+        return True
+    except (ValueError, TypeError):
+        return False
 
 def is_valid_security_group_id(ivsgisg_id: str) -> bool:
     """Check if the input is a valid security group ID format.
@@ -94,7 +204,72 @@ def is_valid_security_group_id(ivsgisg_id: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    return re.match(r'^sg-[0-9a-f]{8,17}$', ivsgisg_id) is not None
+    return _SG_ID_RE.fullmatch(ivsgisg_id) is not None
+
+def _prompt(p_prompt: str, p_validate: Any, p_default: Any = None, p_max_retries: int = 3) -> Any:
+    """Prompt until the validator accepts the input or retries run out.
+
+    One generic retry loop backs every interactive prompt in this module,
+    instead of each helper reimplementing its own counter and messages.
+
+    Args:
+        p_prompt: The message to display to the user.
+        p_validate: Callable mapping the raw input to a value, or to None
+            when the input should be rejected.
+        p_default: The value returned when retries are exhausted.
+        p_max_retries: The maximum number of attempts.
+
+    Returns:
+        The validated value, or p_default if maximum retries reached.
+    """
+    # Build the "retries left" messages up front; each retry then prints a
+    # prebuilt string instead of formatting a fresh one
+    p_messages = tuple(
+        f"Invalid input. You have {p_max_retries - p_attempt - 1} retry(s) left."
+        for p_attempt in range(p_max_retries)
+    )
+    for p_attempt in range(p_max_retries):
+        p_value = p_validate(input(p_prompt))
+        if p_value is not None:
+            return p_value
+        print(p_messages[p_attempt])
+    return p_default
+
+def ask(a_prompt: str, a_cast: Any = str, a_valid: Optional[Any] = None, a_retries: int = 3) -> Any:
+    """Prompt for a typed, validated answer.
+
+    Unlike prompt_with_retries, exhaustion raises instead of returning the
+    'no' sentinel, so a genuine answer of "no" can never be mistaken for
+    ran-out-of-input.
+
+    Args:
+        a_prompt: The message to display to the user.
+        a_cast: Callable applied to the raw input (e.g. int).
+        a_valid: Optional container the cast value must belong to.
+        a_retries: The maximum number of attempts.
+
+    Returns:
+        The cast, validated answer.
+
+    Raises:
+        PromptExhausted: If no acceptable answer arrives within a_retries.
+    """
+    def a_validate(a_raw: str) -> Any:
+        a_raw = a_raw.strip()
+        if not a_raw:
+            return None
+        try:
+            a_value = a_cast(a_raw)
+        except (TypeError, ValueError):
+            return None
+        if a_valid is not None and a_value not in a_valid:
+            return None
+        return a_value
+
+    a_answer = _prompt(a_prompt, a_validate, None, a_retries)
+    if a_answer is None:
+        raise PromptExhausted(f"No valid input received for: {a_prompt.strip()}")
+    return a_answer
 
 def prompt_with_retries(pwr_prompt: str, pwr_max_retries: int = 3) -> str:
     """Prompt the user with a message and allow a maximum number of retries.
@@ -106,139 +281,173 @@ def prompt_with_retries(pwr_prompt: str, pwr_max_retries: int = 3) -> str:
     Returns:
         The user input or 'no' if maximum retries reached.
     """
-    pwr_retries = 0
-    while pwr_retries < pwr_max_retries:
-        pwr_response = input(pwr_prompt)
-        if pwr_response:
-            return pwr_response
+    return _prompt(pwr_prompt, lambda pwr_response: pwr_response or None, 'no', pwr_max_retries)
+
+def _extract_rules(er_response: Dict[str, Any]) -> List[RuleRec]:
+    """Pull the reportable fields out of an authorize response.
+
+    Args:
+        er_response: The response from an authorize_security_group call.
+
+    Returns:
+        One RuleRec per created rule.
+    """
+    return [RuleRec(
+        *_RULE_FIELDS(er_rule),
+        cidr_ipv4=(er_rule.get('IpRanges') or [{}])[0].get('CidrIp', 'N/A'),
+    ) for er_rule in er_response['SecurityGroupRules']]
+
+def prompt_sources() -> Optional[Tuple[List[str], List[str]]]:
+    """Prompt for one or more CIDR blocks or security group IDs for a rule.
+
+    Sources are partitioned by type as they are entered, so the permission
+    builder works from two plain string lists instead of re-classifying a
+    mixed list with isinstance per element.
+
+    Returns:
+        A (cidrs, sgids) pair of the sources collected, or None if maximum
+        retries were reached before any source was entered.
+    """
+    ps_cidrs: List[str] = []
+    ps_sgids: List[str] = []
+    print("You can specify multiple CIDR blocks or Security Group IDs for the same rule.")
+
+    while True:
+        if ps_cidrs or ps_sgids:
+            # Once a source is in, one blank entry finishes the rule
+            ps_source_input = input('Enter another CIDR block or Security Group ID (leave blank to finish): ').strip()
+            if not ps_source_input:
+                return ps_cidrs, ps_sgids
+        else:
+            ps_source_input = prompt_with_retries('Enter CIDR block or Security Group ID: ')
+            if ps_source_input == "no":
+                return None  # Maximum retries reached with nothing entered
+
+        if cr_is_valid_cidr(ps_source_input):
+            ps_cidrs.append(ps_source_input)
+        elif is_valid_security_group_id(ps_source_input):
+            ps_sgids.append(ps_source_input)
         else:
-            pwr_retries += 1
-            print(f"No input provided. You have {pwr_max_retries - pwr_retries} retry(s) left.")
-    return "no"  # Return 'no' if maximum retries reached
+            print("Invalid input. Please enter a valid CIDR block or Security Group ID.")
 
-def create_rule(client: boto3.client, cr_group_id: str, cr_protocol: str, cr_port: int,
-                cr_current_rule_count: int, cr_rule_type: str) -> Union[List[Dict[str, Any]], str]:
-    """Create a rule (ingress or egress) for a security group.
+def build_ip_permissions(bip_rules: List[Tuple[str, int, List[str], List[str]]]) -> List[Dict[str, Any]]:
+    """Merge collected rules into a batched IpPermissions list.
+
+    Rules sharing the same protocol and port collapse into a single permission
+    entry with their sources concatenated, shrinking the request payload.
+
+    Args:
+        bip_rules: Tuples of (protocol, port, cidrs, sgids), with the sources
+            already partitioned into CIDR strings and security group IDs.
+
+    Returns:
+        The IpPermissions list ready for a single authorize call.
+    """
+    bip_merged: Dict[Tuple[str, int], Tuple[List[str], List[str]]] = {}
+    for bip_protocol, bip_port, bip_cidrs, bip_sgids in bip_rules:
+        bip_entry = bip_merged.setdefault((bip_protocol, bip_port), ([], []))
+        bip_entry[0].extend(bip_cidrs)
+        bip_entry[1].extend(bip_sgids)
+
+    # One comprehension per source type; empty lists never enter the request
+    bip_permissions = []
+    for (bip_protocol, bip_port), (bip_cidrs, bip_sgids) in bip_merged.items():
+        bip_permission: Dict[str, Any] = {
+            'IpProtocol': bip_protocol,
+            'FromPort': bip_port,
+            'ToPort': bip_port,
+        }
+        if bip_cidrs:
+            bip_permission['IpRanges'] = [{'CidrIp': bip_cidr} for bip_cidr in bip_cidrs]
+        if bip_sgids:
+            bip_permission['UserIdGroupPairs'] = [{'GroupId': bip_sgid} for bip_sgid in bip_sgids]
+        bip_permissions.append(bip_permission)
+    return bip_permissions
+
+def create_rule(client: boto3.client, cr_group_id: str, cr_ip_permissions: List[Dict[str, Any]],
+                cr_current_rule_count: int, cr_rule_type: str) -> List[RuleRec]:
+    """Authorize a batch of rules (ingress or egress) for a security group.
+
+    All collected permissions go out in a single authorize call, so N rules
+    cost one API round-trip instead of N.
 
     Args:
         client: The Boto3 EC2 client.
         cr_group_id: The ID of the security group.
-        cr_protocol: The protocol (tcp or udp).
-        cr_port: The port number.
+        cr_ip_permissions: The pre-built IpPermissions list to authorize.
         cr_current_rule_count: The current number of rules in the group.
         cr_rule_type: The type of rule ('ingress' or 'egress').
 
     Returns:
-        The details of the created rules or an error message.
+        The details of the created rules.
+
+    Raises:
+        SGError: If the rule limit is hit, a port is out of range, or the
+            authorize call fails.
     """
     try:
-        cr_ip_permissions = []
-        cr_sources = []
-
         # Inform user about the limit
         cr_max_rules = 60
         if cr_current_rule_count >= cr_max_rules:
-            return f"Maximum number of {cr_rule_type} rules reached. No more rules can be added."
-
-        print("You can specify multiple CIDR blocks, but each rule can only accept one CIDR block or one Security Group ID.")
-
-        while True:
-            cr_source_input = prompt_with_retries('Enter CIDR block or Security Group ID (leave blank to finish): ')
-            if cr_source_input == "no":
-                print("Maximum retries reached. Exiting the script.")
-                exit()  # Exit if maximum retries reached
-
-            if cr_is_valid_cidr(cr_source_input):
-                cr_sources.append(cr_source_input)
-            elif is_valid_security_group_id(cr_source_input):
-                cr_sources.append({'GroupId': cr_source_input})
-            else:
-                print("Invalid input. Please enter a valid CIDR block or Security Group ID.")
-
-            if len(cr_sources) > 0:  # If at least one source has been added, break the loop
-                break
-
-        # Create permissions based on the sources
-        for cr_source in cr_sources:
-            if isinstance(cr_source, str):  # CIDR block
-                cr_ip_permissions.append({
-                    'IpProtocol': cr_protocol,
-                    'FromPort': cr_port,
-                    'ToPort': cr_port,
-                    'IpRanges': [{'CidrIp': cr_source}],
-                })
-            elif isinstance(cr_source, dict) and 'GroupId' in cr_source:  # Security group reference
-                cr_ip_permissions.append({
-                    'IpProtocol': cr_protocol,
-                    'FromPort': cr_port,
-                    'ToPort': cr_port,
-                    'UserIdGroupPairs': [{'GroupId': cr_source['GroupId']}],
-                })
-
-        if cr_rule_type == 'ingress':
-            cr_response = client.authorize_security_group_ingress(
-                GroupId=cr_group_id,
-                IpPermissions=cr_ip_permissions
-            )
-        else:  # egress
-            cr_response = client.authorize_security_group_egress(
-                GroupId=cr_group_id,
-                IpPermissions=cr_ip_permissions
-            )
+            raise SGError(f"Maximum number of {cr_rule_type} rules reached. No more rules can be added.")
+
+        # The interactive prompts range-check ports, but programmatic callers
+        # can pass anything; reject bad ports locally instead of after an AWS
+        # round-trip ends in a ClientError
+        for cr_permission in cr_ip_permissions:
+            if not (0 <= cr_permission['FromPort'] <= 65535 and 0 <= cr_permission['ToPort'] <= 65535):
+                raise SGError(f"Invalid port range {cr_permission['FromPort']}-{cr_permission['ToPort']}: ports must be between 0 and 65535.")
+
+        if cr_rule_type not in _DIRECTIONS:
+            raise SGError(f"Unknown rule type '{cr_rule_type}'; expected 'ingress' or 'egress'.")
+        cr_response = getattr(client, _DIRECTIONS[cr_rule_type])(
+            GroupId=cr_group_id,
+            IpPermissions=cr_ip_permissions
+        )
 
         # Extracting details from the response
-        cr_rule_details = []
-        for cr_rule in cr_response['SecurityGroupRules']:
-            cr_rule_details.append({
-                'GroupId': cr_rule['GroupId'],
-                'SecurityGroupRuleId': cr_rule['SecurityGroupRuleId'],
-                'IpProtocol': cr_rule['IpProtocol'],
-                'FromPort': cr_rule['FromPort'],
-                'ToPort': cr_rule['ToPort'],
-                'CidrIpv4': cr_rule.get('IpRanges', [{}])[0].get('CidrIp', 'N/A')
-            })
-
-        return cr_rule_details
+        return _extract_rules(cr_response)
     except ClientError as e:
-        return f"An error occurred while adding {cr_rule_type} rule: {e}"
+        raise SGError(f"An error occurred while adding {cr_rule_type} rule: {e}") from e
 
-def print_rule_details(prd_rules: Union[List[Dict[str, Any]], str]) -> None:
+def print_rule_details(prd_rules: List[RuleRec]) -> None:
     """Print the details of the ingress or egress rules.
 
     Args:
-        prd_rules: The rules to print or an error message.
+        prd_rules: The rules to print.
     """
-    if isinstance(prd_rules, str):
-        print(prd_rules)  # Print error message
-    elif isinstance(prd_rules, list):
-        for prd_rule in prd_rules:
-            if isinstance(prd_rule, dict):  # Ensure each rule is a dictionary
-                print(f"GroupId: {prd_rule.get('GroupId', 'N/A')}")
-                print(f"SecurityGroupRuleId: {prd_rule.get('SecurityGroupRuleId', 'N/A')}")
-                print(f"IpProtocol: {prd_rule.get('IpProtocol', 'N/A')}")
-                print(f"FromPort: {prd_rule.get('FromPort', 'N/A')}")
-                print(f"ToPort: {prd_rule.get('ToPort', 'N/A')}")
-                print(f"CidrIpv4: {prd_rule.get('CidrIpv4', 'N/A')}")
-                print()  # Print a new line for better readability
-            else:
-                print("Unexpected rule format. Expected a dictionary.")
-    else:
-        print("Unexpected input type. Expected a list or a string.")
+    # Stream one block per rule straight into the buffered stdout; writelines
+    # consumes the generator without materialising the joined report string
+    sys.stdout.writelines(
+        f"GroupId: {prd_rule.group_id}\n"
+        f"SecurityGroupRuleId: {prd_rule.rule_id}\n"
+        f"IpProtocol: {prd_rule.protocol}\n"
+        f"FromPort: {prd_rule.from_port}\n"
+        f"ToPort: {prd_rule.to_port}\n"
+        f"CidrIpv4: {prd_rule.cidr_ipv4}\n\n"
+        for prd_rule in prd_rules
+    )
+
+def _validate_protocol(vp_raw: str) -> Optional[str]:
+    """Normalise a protocol entry, or return None if it is not supported."""
+    vp_protocol = vp_raw.strip().casefold()  # Normalise once before the set lookup
+    return vp_protocol if vp_protocol in _VALID_PROTOCOLS else None
+
+def _validate_port(vp_raw: str) -> Optional[int]:
+    """Parse a port entry, or return None if it is not a port number."""
+    try:
+        vp_port = int(vp_raw)  # Attempt to convert to integer
+    except ValueError:
+        return None
+    return vp_port if 0 <= vp_port <= 65535 else None
 
 def prompt_protocol() -> Optional[str]:
-    """Prompt for a valid protocol (tcp or udp).
+    """Prompt for a valid protocol (tcp, udp, icmp, or -1 for all).
 
     Returns:
         The protocol if valid, None if maximum retries reached.
     """
-    while True:
-        pp_protocol = prompt_with_retries('Enter the protocol (tcp or udp): ')
-        if pp_protocol == 'no':  # Check if maximum retries reached
-            return None  # Indicate failure to the caller
-        if pp_protocol in ['tcp', 'udp']:
-            return pp_protocol
-        else:
-            print("Invalid protocol. Please enter 'tcp' or 'udp'.")
+    return _prompt('Enter the protocol (tcp, udp, icmp, or -1 for all): ', _validate_protocol)
 
 def prompt_port() -> Optional[int]:
     """Prompt for a valid port number.
@@ -246,104 +455,118 @@ def prompt_port() -> Optional[int]:
     Returns:
         The port number if valid, None if maximum retries reached.
     """
-    while True:
-        pp_port = prompt_with_retries('Enter the port number (0-65535): ')
-        if pp_port == 'no':  # Check if maximum retries reached
-            return None  # Indicate failure to the caller
-        try:
-            pp_port = int(pp_port)  # Attempt to convert to integer
-            if 0 <= pp_port <= 65535:
-                return pp_port  # Valid port number
-            else:
-                print("Port number must be between 0 and 65535.")
-        except ValueError:
-            print("Please enter a valid integer for the port number.")
+    return _prompt('Enter the port number (0-65535): ', _validate_port)
 
 if __name__ == '__main__':
-    # Prompt user input for security group
-    group_name = prompt_with_retries('Enter Security Group Name: ')
-    if group_name == 'no':
-        exit()  # Exit if maximum retries reached
-
-    group_description = prompt_with_retries('Enter Security Group Description: ')
-    if group_description == 'no':
-        exit()  # Exit if maximum retries reached
-
-    vpc_id = prompt_with_retries('Enter Security Group VPC ID: ')
-    if vpc_id == 'no':
-        exit()  # Exit if maximum retries reached
-
-    tag_value = prompt_with_retries('Enter Security Group Tag Name Value: ')
-    if tag_value == 'no':
-        exit()  # Exit if maximum retries reached
-
-    # Check if the security group already exists
-    if security_group_exists(ec2, group_name, vpc_id):
-        print(f"Security group '{group_name}' already exists in VPC '{vpc_id}'.")
-    else:
-        # Create the security group
-        response = create_security_group(ec2, group_name, group_description, vpc_id)
-        if isinstance(response, str):
-            print(response)  # Print error message
-        else:
-            # Tag the security group
-            tagged_value = tag_security_group(ec2, response['GroupId'], tag_value)
-            print(tagged_value)
+    ec2 = get_ec2_client()  # Shared, pooled client; built here rather than at import
 
-            print(f"Security Group Created:\n    GroupId: {response['GroupId']}")
+    # Prompt user input for security group; exhaustion raises instead of
+    # returning a 'no' sentinel that could collide with a real answer
+    try:
+        group_name = ask('Enter Security Group Name: ')
+        group_description = ask('Enter Security Group Description: ')
+        vpc_id = ask('Enter Security Group VPC ID: ')
+        tag_value = ask('Enter Security Group Tag Name Value: ')
+    except PromptExhausted as e:
+        print(e)
+        sys.exit(1)
+
+    try:
+        # Check if the security group already exists
+        if security_group_exists(ec2, group_name, vpc_id):
+            print(f"Security group '{group_name}' already exists in VPC '{vpc_id}'.")
+        else:
+            # Create the security group
+            response = create_security_group(ec2, group_name, group_description, vpc_id)
+            group_id = response['GroupId']
+            print(f"Security Group Created:\n    GroupId: {group_id}")
 
             # Initialize rule counters
             ingress_rule_count = 0
 
-            # Prompt to create ingress rules
-            while True:
-                create_ingress = prompt_with_retries("Do you want to create an ingress rule? (yes/no): ")
-                if create_ingress == 'no':
-                    break  # Exit the loop if the user doesn't want to create ingress rules
-                elif create_ingress == 'yes':
+            # Collect every ingress rule first, then authorize them in one call
+            pending_ingress = []
+            try:
+                while True:
+                    create_ingress = ask("Do you want to create an ingress rule? (yes/no): ", a_valid=_YES_NO)
+                    if create_ingress not in _AFFIRMATIVE:
+                        break  # Exit the loop if the user doesn't want to create ingress rules
                     protocol = prompt_protocol()
                     if protocol is None:  # Check if the user has exhausted retries
-                        print("Maximum retries reached for protocol input. Exiting the script.")
-                        exit()  # Exit if maximum retries reached
+                        print("Maximum retries reached for protocol input. Submitting the rules collected so far.")
+                        break  # Stop collecting; the tag/authorize phase still runs
 
                     port = prompt_port()
                     if port is None:  # Check if the user has exhausted retries
-                        print("Maximum retries reached for port input. Exiting the script.")
-                        exit()  # Exit if maximum retries reached
+                        print("Maximum retries reached for port input. Submitting the rules collected so far.")
+                        break  # Stop collecting; the tag/authorize phase still runs
 
-                    ingress_response = create_rule(ec2, response['GroupId'], protocol, port, ingress_rule_count,
-                                                   'ingress')
-                    print_rule_details(ingress_response)  # Print the result
+                    sources = prompt_sources()
+                    if sources is None:  # Check if the user has exhausted retries
+                        print("Maximum retries reached for source input. Submitting the rules collected so far.")
+                        break  # Stop collecting; the tag/authorize phase still runs
 
-                    if isinstance(ingress_response, list):
-                        ingress_rule_count += len(ingress_response)  # Increment the count of ingress rules added
-                        print(f"Total ingress rules now: {ingress_rule_count}")
+                    pending_ingress.append((protocol, port, *sources))
 
-                    another_ingress = prompt_with_retries("Do you want to create another ingress rule? (yes/no): ")
-                    if another_ingress != 'yes':
+                    another_ingress = ask("Do you want to create another ingress rule? (yes/no): ", a_valid=_YES_NO)
+                    if another_ingress not in _AFFIRMATIVE:
                         break  # Exit the loop if the user doesn't want to create another rule
+            except PromptExhausted:
+                print("Input retries exhausted. Submitting the rules collected so far.")
 
             # After exiting the ingress loop, prompt for egress rules
-            create_egress = prompt_with_retries("Do you want to create an egress rule? (yes/no): ")
-            if create_egress == 'no':
-                exit()  # Exit if maximum retries reached or user chooses not to create egress rules
-            elif create_egress == 'yes':
-                egress_rule_count = 0
-                while True:
-                    protocol = prompt_protocol()
-                    if protocol is None:  # Check if the user has exhausted retries
-                        print("Maximum retries reached for protocol input. Exiting the script.")
-                        exit()  # Exit if maximum retries reached
-                    port = prompt_port()
-                    if port is None:  # Check if the user has exhausted retries
-                        print("Maximum retries reached for port input. Exiting the script.")
-                        exit()  # Exit if maximum retries reached
-                    egress_response = create_rule(ec2, response['GroupId'], protocol, port, egress_rule_count, 'egress')
-                    print_rule_details(egress_response)  # Print the result
-                    if isinstance(egress_response, list):
-                        egress_rule_count += len(egress_response)  # Increment the count of egress rules added
-                        print(f"Total egress rules now: {egress_rule_count}")
-
-                    another_egress = prompt_with_retries("Do you want to create another egress rule? (yes/no): ")
-                    if another_egress != 'yes':
-                        break  # Exit the loop if the user doesn't want to create another rule
+            egress_rule_count = 0
+            pending_egress = []
+            try:
+                if ask("Do you want to create an egress rule? (yes/no): ", a_valid=_YES_NO) in _AFFIRMATIVE:
+                    while True:
+                        protocol = prompt_protocol()
+                        if protocol is None:  # Check if the user has exhausted retries
+                            print("Maximum retries reached for protocol input. Submitting the rules collected so far.")
+                            break  # Stop collecting; the tag/authorize phase still runs
+                        port = prompt_port()
+                        if port is None:  # Check if the user has exhausted retries
+                            print("Maximum retries reached for port input. Submitting the rules collected so far.")
+                            break  # Stop collecting; the tag/authorize phase still runs
+                        sources = prompt_sources()
+                        if sources is None:  # Check if the user has exhausted retries
+                            print("Maximum retries reached for source input. Submitting the rules collected so far.")
+                            break  # Stop collecting; the tag/authorize phase still runs
+
+                        pending_egress.append((protocol, port, *sources))
+
+                        another_egress = ask("Do you want to create another egress rule? (yes/no): ", a_valid=_YES_NO)
+                        if another_egress not in _AFFIRMATIVE:
+                            break  # Exit the loop if the user doesn't want to create another rule
+            except PromptExhausted:
+                print("Input retries exhausted. Submitting the rules collected so far.")
+
+            # Tagging and the two authorize batches hit independent APIs, so
+            # submit them together and overlap the three round-trips
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                tag_future = executor.submit(tag_security_group, ec2, group_id, tag_value)
+                ingress_future = executor.submit(
+                    create_rule, ec2, group_id, build_ip_permissions(pending_ingress),
+                    ingress_rule_count, 'ingress'
+                ) if pending_ingress else None
+                egress_future = executor.submit(
+                    create_rule, ec2, group_id, build_ip_permissions(pending_egress),
+                    egress_rule_count, 'egress'
+                ) if pending_egress else None
+
+            print(tag_future.result())
+
+            if ingress_future is not None:
+                ingress_response = ingress_future.result()
+                print_rule_details(ingress_response)  # Print the result
+                ingress_rule_count += len(ingress_response)  # Increment the count of ingress rules added
+                print(f"Total ingress rules now: {ingress_rule_count}")
+
+            if egress_future is not None:
+                egress_response = egress_future.result()
+                print_rule_details(egress_response)  # Print the result
+                egress_rule_count += len(egress_response)  # Increment the count of egress rules added
+                print(f"Total egress rules now: {egress_rule_count}")
+    except SGError as e:
+        print(e)
+        sys.exit(1)
@@ -1,42 +1,51 @@
 import boto3
 from botocore.exceptions import ClientError
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2
 
 # Constants for VPC
 TAG_VPC_NAME = 'AcmeLabs-Dev'  # Name tag for the VPC
 TAG_VPC_ENV = 'Dev'  # Environment tag for the VPC
 CIDR_BLOCK = '10.0.0.0/16'  # CIDR block for the VPC
 
-def vpc_exists(client: boto3.client, ve_cidr: str, ve_tag_name: str, ve_tag_env: str) -> tuple[bool, str]:
+# Filters for the target VPC, built once from the constants above instead
+# of re-allocating the nested dicts on every lookup
+_VPC_FILTERS = [
+    {'Name': 'cidr', 'Values': [CIDR_BLOCK]},  # Filter by CIDR block
+    {'Name': 'tag:Name', 'Values': [TAG_VPC_NAME]},  # Filter by Name tag
+    {'Name': 'tag:Environment', 'Values': [TAG_VPC_ENV]}  # Filter by Environment tag
+]
+
+def find_vpc(client: boto3.client) -> tuple[str, str]:
     """
-    Check if a VPC exists with the specified CIDR block and tags.
+    Find an existing VPC matching this script's CIDR block and tags.
+
+    CreateVpc has no idempotency token, so this single describe is the only
+    safe duplicate guard; returning the matched VPC ID here means no caller
+    ever needs a second lookup to identify the existing VPC.
 
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
-        ve_cidr (str): The CIDR block of the VPC to check.
-        ve_tag_name (str): The name tag of the VPC to check.
-        ve_tag_env (str): The environment tag of the VPC to check.
 
     Returns:
-        tuple: (bool, str) indicating if the VPC exists and an error message if applicable.
+        tuple: (str, str) containing the existing VPC ID (empty if none) and an error message if applicable.
     """
     try:
-        # Describe VPCs based on the provided filters
-        ve_response = client.describe_vpcs(
-            Filters=[
-                {'Name': 'cidr', 'Values': [ve_cidr]},  # Filter by CIDR block
-                {'Name': 'tag:Name', 'Values': [ve_tag_name]},  # Filter by Name tag
-                {'Name': 'tag:Environment', 'Values': [ve_tag_env]}  # Filter by Environment tag
-            ]
+        # Describe VPCs based on the prebuilt filters, stopping at the first
+        # match so the response carries a single record at most
+        fv_pages = client.get_paginator('describe_vpcs').paginate(
+            Filters=_VPC_FILTERS,
+            PaginationConfig={'MaxItems': 1, 'PageSize': 5}
         )
-        # Return True if any VPCs match the filters
-        return (len(ve_response['Vpcs']) > 0, "")
+        # Return the ID of the first matching VPC, if any
+        for fv_page in fv_pages:
+            if fv_page['Vpcs']:
+                return (fv_page['Vpcs'][0]['VpcId'], "")
+        return ("", "")
     except ClientError as e:
         error_message = f"Error checking VPC existence: {e}"
         print(error_message)  # Print error for local use
-        return (False, error_message)
+        return ("", error_message)
 
 def create_vpc(client: boto3.client, cv_cidr_block: str, cv_tag_name: str, cv_tag_env: str) -> tuple[str, str]:
     """
@@ -73,16 +82,19 @@ def create_vpc(client: boto3.client, cv_cidr_block: str, cv_tag_name: str, cv_ta
         return ("", error_message)
 
 if __name__ == '__main__':
-    # Check if the specified VPC exists
-    vpc_exists_result, vpc_exists_error = vpc_exists(ec2, CIDR_BLOCK, TAG_VPC_NAME, TAG_VPC_ENV)
+    ec2 = get_ec2()  # Built here rather than at import
+
+    # Check if the specified VPC exists; the same call surfaces its ID
+    existing_vpc_id, vpc_exists_error = find_vpc(ec2)
 
-    if vpc_exists_result:
+    if existing_vpc_id:
         print(f"VPC Exists:\n"
+              f"    VPC ID: {existing_vpc_id}\n"
               f"    Name: {TAG_VPC_NAME}\n"
               f"    Environment: {TAG_VPC_ENV}\n"
               f"    CIDR Block: {CIDR_BLOCK}"
         )
-    else:
+    elif not vpc_exists_error:  # Only create when the lookup itself succeeded
         vpc_id, create_vpc_error = create_vpc(ec2, CIDR_BLOCK, TAG_VPC_NAME, TAG_VPC_ENV)
 
         if create_vpc_error:
@@ -1,9 +1,9 @@
 import boto3
 from botocore.exceptions import ClientError
-from typing import Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple, Optional
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2
 
 # Constants for subnets
 TAG_VPC_NAME = 'AcmeLabs-Dev'  # Name tag for the VPC
@@ -35,48 +35,47 @@ def get_vpc_id(client: boto3.client) -> Tuple[Optional[str], Optional[str]]:
     - Tuple containing the VPC ID and an error message (if any)
     """
     try:
-        gvi_response = client.describe_vpcs(
+        # Stop at the first match instead of fetching the full VPC list
+        gvi_pages = client.get_paginator('describe_vpcs').paginate(
             Filters=[
                 {'Name': 'tag:Name', 'Values': [TAG_VPC_NAME]}
-            ]
+            ],
+            PaginationConfig={'MaxItems': 1, 'PageSize': 5}
         )
-        if gvi_response['Vpcs']:
-            return gvi_response['Vpcs'][0]['VpcId'], None
-        else:
-            return None, "No matching VPC found."
+        for gvi_page in gvi_pages:
+            if gvi_page['Vpcs']:
+                return gvi_page['Vpcs'][0]['VpcId'], None
+        return None, "No matching VPC found."
     except ClientError as e:
         return None, f"Error checking VPC existence: {e}"
 
-def subnet_exists(se_cidr_block: str, se_tag_name: str, se_tag_env: str, se_vpc_id: str, se_availability_zone: str) -> Tuple[bool, Optional[str]]:
+def get_existing_subnets(ges_vpc_id: str, ges_cidr_blocks: List[str]) -> Tuple[Dict[str, dict], Optional[str]]:
     """
-    Check if a subnet exists based on provided parameters.
+    Fetch every target subnet in the VPC with a single describe call.
+
+    One multi-value cidr-block filter replaces a describe_subnets round-trip
+    per subnet; existence checks then become local dict lookups.
 
     Parameters:
-    - se_cidr_block: CIDR block of the subnet
-    - se_tag_name: Name tag of the subnet
-    - se_tag_env: Environment tag of the subnet
-    - se_vpc_id: VPC ID where the subnet is located
-    - se_availability_zone: Availability zone of the subnet
+    - ges_vpc_id: VPC ID where the subnets are located
+    - ges_cidr_blocks: CIDR blocks to look for
 
     Returns:
-    - Tuple containing a boolean indicating existence and an error message (if any)
+    - Tuple containing a dict of existing subnets keyed by CIDR block and an error message (if any)
     """
     try:
-        se_response = ec2.describe_subnets(
+        ges_response = get_ec2().describe_subnets(
             Filters=[
-                {'Name': 'cidr-block', 'Values': [se_cidr_block]},
-                {'Name': 'tag:Name', 'Values': [se_tag_name]},
-                {'Name': 'tag:Environment', 'Values': [se_tag_env]},
-                {'Name': 'vpc-id', 'Values': [se_vpc_id]},
-                {'Name': 'availability-zone', 'Values': [se_availability_zone]}
+                {'Name': 'vpc-id', 'Values': [ges_vpc_id]},
+                {'Name': 'cidr-block', 'Values': ges_cidr_blocks}
             ]
         )
-        se_exists = len(se_response['Subnets']) > 0
-        return se_exists, None
+        return {ges_subnet['CidrBlock']: ges_subnet for ges_subnet in ges_response['Subnets']}, None
     except ClientError as e:
-        return False, f"Error describing subnets: {e}"
+        return {}, f"Error describing subnets: {e}"
 
-def create_subnet(cs_cidr_block: str, cs_azs: str, cs_tag_name: str, cs_tag_env: str) -> Tuple[Optional[str], Optional[str]]:
+def create_subnet(cs_cidr_block: str, cs_azs: str, cs_tag_name: str, cs_tag_env: str, cs_vpc_id: str,
+                  cs_existing: Dict[str, dict]) -> Tuple[Optional[str], Optional[str]]:
     """
     Create a subnet if it doesn't already exist.
 
@@ -85,19 +84,13 @@ def create_subnet(cs_cidr_block: str, cs_azs: str, cs_tag_name: str, cs_tag_env:
     - cs_azs: Availability zone for the new subnet
     - cs_tag_name: Name tag for the new subnet
     - cs_tag_env: Environment tag for the new subnet
+    - cs_vpc_id: ID of the VPC to create the subnet in
+    - cs_existing: Subnets already in the VPC, keyed by CIDR block
 
     Returns:
     - Tuple containing the created subnet ID and an error message (if any)
     """
-    cs_vpc_id, cs_vpc_error = get_vpc_id(ec2)
-    if cs_vpc_error:
-        return None, cs_vpc_error
-
-    cs_exists, cs_error_message = subnet_exists(cs_cidr_block, cs_tag_name, cs_tag_env, cs_vpc_id, cs_azs)
-    if cs_error_message:
-        return None, cs_error_message
-
-    if cs_exists:
+    if cs_cidr_block in cs_existing:
         return None, (
             f"Subnet Exists:\n"
             f"    Name: {cs_tag_name}\n"
@@ -107,7 +100,7 @@ def create_subnet(cs_cidr_block: str, cs_azs: str, cs_tag_name: str, cs_tag_env:
         )
 
     try:
-        cs_public_subnet = ec2.create_subnet(
+        cs_public_subnet = get_ec2().create_subnet(
             TagSpecifications=[
                 {
                     'ResourceType': 'subnet',
@@ -127,10 +120,28 @@ def create_subnet(cs_cidr_block: str, cs_azs: str, cs_tag_name: str, cs_tag_env:
         return None, f"Error creating subnet: {e}"
 
 if __name__ == '__main__':
-    # Iterate over CIDR blocks, availability zones, and tags to create subnets
-    for cidr, az, tag in zip(CIDR_PUBLIC_SUBNETS, AVAILABILITY_ZONES, TAG_SUBNETS):
-        subnet_id, error = create_subnet(cidr, az, tag, TAG_SUBNET_ENV)  # Use TAG_SUBNET_ENV directly
-        if error:
-            print(error)  # Print error for local use
+    # Resolve the VPC once; every subnet below shares the same VPC, so the
+    # per-iteration describe_vpcs round-trip is gone
+    vpc_id, vpc_error = get_vpc_id(get_ec2())
+    if vpc_error:
+        print(vpc_error)  # Print error for local use
+    else:
+        # One describe covers all target CIDR blocks; the loop then checks
+        # existence locally instead of issuing a describe per subnet
+        existing, existing_error = get_existing_subnets(vpc_id, CIDR_PUBLIC_SUBNETS)
+        if existing_error:
+            print(existing_error)  # Print error for local use
         else:
-            print(f"Created Subnet ID: {subnet_id}")  # Print success message
+            # The subnet creations are independent API calls, so overlap
+            # their round-trips instead of paying them one after another
+            with ThreadPoolExecutor(max_workers=len(CIDR_PUBLIC_SUBNETS)) as executor:
+                futures = [
+                    executor.submit(create_subnet, cidr, az, tag, TAG_SUBNET_ENV, vpc_id, existing)
+                    for cidr, az, tag in zip(CIDR_PUBLIC_SUBNETS, AVAILABILITY_ZONES, TAG_SUBNETS)
+                ]
+                for future in as_completed(futures):
+                    subnet_id, error = future.result()
+                    if error:
+                        print(error)  # Print error for local use
+                    else:
+                        print(f"Created Subnet ID: {subnet_id}")  # Print success message
@@ -1,78 +1,107 @@
 import boto3
 from botocore.exceptions import ClientError
 from typing import Tuple, Optional
+import functools
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2
 
 # Constants for route table
 TAG_VPC_NAME = 'AcmeLabs-Dev'  # Name tag for the VPC
 TAG_RTB = 'AcmeLabs-Dev-RouteTable'  # Name tag for the route table
 TAG_RTB_ENV = 'Dev'  # Environment tag for the route table
 
-def get_vpc_id(client: boto3.client) -> Tuple[Optional[str], Optional[str]]:
+# Static filter pieces built once from the constants above; the vpc-id
+# filter is appended per call since the VPC is resolved at runtime
+_VPC_NAME_FILTERS = [
+    {'Name': 'tag:Name', 'Values': [TAG_VPC_NAME]}  # Filter by Name tag
+]
+_RTB_TAG_FILTERS = [
+    {'Name': 'tag:Name', 'Values': [TAG_RTB]},  # Filter for the Name tag
+    {'Name': 'tag:Environment', 'Values': [TAG_RTB_ENV]}  # Filter for the Environment tag
+]
+
+@functools.lru_cache(maxsize=1)
+def _lookup_vpc_id() -> str:
+    """
+    Resolve the ID of the VPC tagged 'AcmeLabs-Dev', memoizing the hit.
+
+    The tag is a constant, so repeated calls in the same process (or from
+    scripts importing this module) resolve locally instead of repeating the
+    describe_vpcs round-trip. Failures raise, and lru_cache never stores a
+    raising call, so only a successful lookup is memoized.
+
+    Returns:
+        str: The VPC ID of the first matching VPC.
+
+    Raises:
+        LookupError: If no VPC matches the name tag.
+        ClientError: If the describe call fails.
+    """
+    # Describe VPCs based on the provided filters, stopping at the first
+    # match instead of fetching the full VPC list
+    gvi_pages = get_ec2().get_paginator('describe_vpcs').paginate(
+        Filters=_VPC_NAME_FILTERS,
+        PaginationConfig={'MaxItems': 1, 'PageSize': 5}
+    )
+    for gvi_page in gvi_pages:
+        if gvi_page['Vpcs']:
+            return gvi_page['Vpcs'][0]['VpcId']
+    raise LookupError("No matching VPC found.")
+
+def get_vpc_id() -> Tuple[Optional[str], Optional[str]]:
     """
     Check if a VPC exists with the specified name tag 'AcmeLabs-Dev'.
     If it exists, return the VPC ID.
 
-    Args:
-        client (boto3.client): The EC2 client used to interact with AWS.
-
     Returns:
         Tuple[Optional[str], Optional[str]]: The VPC ID if the VPC exists, or an error message.
     """
     try:
-        # Describe VPCs based on the provided filters
-        gvi_response = client.describe_vpcs(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [TAG_VPC_NAME]}  # Filter by Name tag
-            ]
-        )
-
-        # Check if any VPCs match the filters and return the VPC ID
-        if gvi_response['Vpcs']:
-            return gvi_response['Vpcs'][0]['VpcId'], None  # Return the VPC ID of the first matching VPC
-        else:
-            return None, "No matching VPC found."  # No matching VPC found
+        return _lookup_vpc_id(), None
+    except LookupError as e:
+        return None, str(e)  # No matching VPC found
     except ClientError as e:
         return None, f"Error checking VPC existence: {e}"  # Return error message
 
-def route_table_exists(client: boto3.client, rte_tag_name: str, rte_tag_env: str, rte_vpc_id: str) -> Tuple[bool, Optional[str]]:
+def route_table_exists(client: boto3.client, rte_vpc_id: str) -> Tuple[bool, Optional[str]]:
     """
-    Check if a route table exists in the specified VPC with the given tags.
+    Check if this script's route table exists in the specified VPC.
 
     Args:
         client (boto3.client): The Boto3 EC2 client.
-        rte_tag_name (str): The name tag of the route table.
-        rte_tag_env (str): The environment tag of the route table.
         rte_vpc_id (str): The ID of the VPC.
 
     Returns:
         Tuple[bool, Optional[str]]: True if the route table exists, False otherwise, with an optional error message.
     """
     try:
-        # Describe route tables with specified filters
-        rte_response = client.describe_route_tables(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [rte_tag_name]},  # Filter for the Name tag
-                {'Name': 'tag:Environment', 'Values': [rte_tag_env]},  # Filter for the Environment tag
+        # Describe route tables with specified filters, stopping as soon as
+        # one match proves existence
+        rte_pages = client.get_paginator('describe_route_tables').paginate(
+            Filters=_RTB_TAG_FILTERS + [
                 {'Name': 'vpc-id', 'Values': [rte_vpc_id]}  # Filter for the VPC ID
-            ]
+            ],
+            PaginationConfig={'MaxItems': 1, 'PageSize': 5}
         )
         # Return True if any route tables are found
-        return len(rte_response['RouteTables']) > 0, None
+        for rte_page in rte_pages:
+            if rte_page['RouteTables']:
+                return True, None
+        return False, None
     except ClientError as e:
         # Handle client error and return False with an error message
         return False, f"Error checking route table existence: {e}"
 
 if __name__ == '__main__':
+    ec2 = get_ec2()  # Built here rather than at import
+
     # Check if the VPC ID can be retrieved
-    vpc_id, error_msg = get_vpc_id(ec2)
+    vpc_id, error_msg = get_vpc_id()
     if error_msg:
         print(error_msg)  # Print error message if VPC ID retrieval fails
     else:
         # Check if the route table exists and print the result
-        exists, error_msg = route_table_exists(ec2, TAG_RTB, TAG_RTB_ENV, vpc_id)
+        exists, error_msg = route_table_exists(ec2, vpc_id)
         if error_msg:
             print(error_msg)  # Print error message if route table existence check fails
         elif exists:
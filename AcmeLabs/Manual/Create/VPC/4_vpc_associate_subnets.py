@@ -1,15 +1,42 @@
 import boto3
 from botocore.exceptions import ClientError
-from typing import Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Union
+import json
+import sys
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from acme_aws_cache import describe_route_tables_by_tag
+from clients import get_ec2
 
 # Constants for route table association
 TAG_SUBNET = 'AcmeLabs-Dev-Public-Subnet'
 TAG_RTB = 'AcmeLabs-Dev-RouteTable'
+STACK_NAME = 'acme-dev-subnet-associations'  # CloudFormation stack for --stack runs
 
-def get_route_table_id(client: boto3.client, grti_rtb_tag: str) -> Union[str, str]:
+# Static describe filter built once from the constants above instead of
+# re-allocating the nested dicts on every lookup
+SUBNET_FILTERS = [
+    {'Name': 'tag:Name', 'Values': [f'{TAG_SUBNET}*']}  # Name-prefix wildcard
+]
+
+class AwsLookupError(Exception):
+    """Raised when a tagged AWS resource lookup fails or finds nothing."""
+
+@dataclass(slots=True, frozen=True)
+class SubnetInfo:
+    """One discovered subnet, trimmed to the reportable fields.
+
+    A slotted record is a fraction of the size of the equivalent dict and
+    reads fields with a fixed-offset load instead of a hashed lookup, which
+    matters when a large VPC returns hundreds of subnets.
+    """
+    subnet_id: str
+    cidr: str
+    az: str
+    vpc_id: str
+
+def get_route_table_id(client: boto3.client, grti_rtb_tag: str) -> str:
     """
     Retrieve the Route Table ID based on the given tag.
 
@@ -18,70 +45,65 @@ def get_route_table_id(client: boto3.client, grti_rtb_tag: str) -> Union[str, st
         grti_rtb_tag: The tag name of the route table to retrieve.
 
     Returns:
-        The Route Table ID or an error message.
+        The Route Table ID.
+
+    Raises:
+        AwsLookupError: If no route table matches or the lookup fails.
     """
     try:
-        # Describe route tables with the specified tag
-        grti_response = client.describe_route_tables(
-            Filters=[
-                {
-                    'Name': 'tag:Name',
-                    'Values': [grti_rtb_tag]
-                }
-            ]
-        )
+        # Describe route tables with the specified tag; the shared cache
+        # answers repeat lookups within its TTL without another API call
+        grti_route_tables = describe_route_tables_by_tag(client, grti_rtb_tag)
         # Check if any route tables were found
-        if grti_response['RouteTables']:
-            return grti_response['RouteTables'][0]['RouteTableId']
-        else:
-            return f"No route table found with tag: {grti_rtb_tag}"
+        if grti_route_tables:
+            return grti_route_tables[0]['RouteTableId']
+        raise AwsLookupError(f"No route table found with tag: {grti_rtb_tag}")
     except ClientError as e:
-        return f"Client error retrieving route table ID: {e.response['Error']['Message']}"
-    except Exception as e:
-        return f"Error retrieving route table ID: {str(e)}"
+        raise AwsLookupError(f"Client error retrieving route table ID: {e.response['Error']['Message']}") from e
 
-def get_subnet_info(client: boto3.client, gsi_tag_start: str) -> Tuple[Union[Dict[str, Dict[str, str]], str], Union[List[str], str]]:
+def get_subnet_info(client: boto3.client, gsi_filters: List[Dict[str, Any]] = SUBNET_FILTERS) -> Tuple[Dict[str, SubnetInfo], List[str]]:
     """
-    Get subnet information based on the specified tag prefix.
+    Get subnet information matching the given describe filters.
 
     Args:
         client: Boto3 EC2 client.
-        gsi_tag_start: The starting prefix for the subnet names.
+        gsi_filters: The describe_subnets filters; defaults to the module's
+            Name-prefix filter.
 
     Returns:
-        A tuple containing a dictionary of subnet details and a list of subnet IDs or an error message.
-    """
-    gsi_filters = [
-        {
-            'Name': 'tag:Name',
-            'Values': [f'{gsi_tag_start}*']
-        }
-    ]
+        A tuple containing a dictionary of SubnetInfo records keyed by subnet ID
+        and a list of subnet IDs.
 
+    Raises:
+        AwsLookupError: If the subnet lookup fails.
+    """
     try:
-        # Describe subnets with the specified filters
-        gsi_response = client.describe_subnets(Filters=gsi_filters)['Subnets']
+        # Describe subnets with the specified filters, paginating so matches
+        # past the first page still surface on large accounts
+        gsi_response = []
+        for gsi_page in client.get_paginator('describe_subnets').paginate(
+            Filters=gsi_filters,
+            PaginationConfig={'PageSize': 1000}
+        ):
+            gsi_response.extend(gsi_page['Subnets'])
         gsi_subnet_details = {}
         gsi_subnet_ids = []
 
-        # Iterate through the subnets and gather details
+        # The server-side wildcard filter already guaranteed the Name match,
+        # so build each record directly instead of re-scanning its Tags array
         for gsi_subnet in gsi_response:
-            if 'Tags' in gsi_subnet:
-                for tag in gsi_subnet['Tags']:
-                    if tag['Key'] == 'Name' and tag['Value'].startswith(gsi_tag_start):
-                        gsi_subnet_ids.append(gsi_subnet['SubnetId'])
-                        gsi_subnet_details[gsi_subnet['SubnetId']] = {
-                            'Subnet ID': gsi_subnet['SubnetId'],
-                            'CIDR Block': gsi_subnet['CidrBlock'],
-                            'Availability Zone': gsi_subnet['AvailabilityZone'],
-                            'VPC ID': gsi_subnet['VpcId']
-                        }
+            gsi_subnet_id = gsi_subnet['SubnetId']
+            gsi_subnet_ids.append(gsi_subnet_id)
+            gsi_subnet_details[gsi_subnet_id] = SubnetInfo(
+                subnet_id=gsi_subnet_id,
+                cidr=gsi_subnet['CidrBlock'],
+                az=gsi_subnet['AvailabilityZone'],
+                vpc_id=gsi_subnet['VpcId']
+            )
 
         return gsi_subnet_details, gsi_subnet_ids
     except ClientError as e:
-        return {}, f"Client error retrieving subnet information: {e.response['Error']['Message']}"
-    except Exception as e:
-        return {}, f"Error retrieving subnet information: {str(e)}"
+        raise AwsLookupError(f"Client error retrieving subnet information: {e.response['Error']['Message']}") from e
 
 def associate_route_table(client: boto3.client, art_subnets: List[str], art_rtb: str) -> List[Tuple[str, Union[Dict[str, str], str]]]:
     """
@@ -95,63 +117,146 @@ def associate_route_table(client: boto3.client, art_subnets: List[str], art_rtb:
     Returns:
         A list of tuples containing subnet IDs and the corresponding response or error message.
     """
-    art_results = []
-    for art_subnet in art_subnets:
+    def art_associate(art_subnet: str) -> Tuple[str, Union[Dict[str, str], str]]:
         try:
             # Associate the route table with the subnet
             art_response = client.associate_route_table(
                 SubnetId=art_subnet,
                 RouteTableId=art_rtb
             )
-            art_results.append((art_subnet, art_response))
+            return art_subnet, art_response
         except ClientError as e:
-            art_results.append((art_subnet, f"Client error associating Route Table: {e.response['Error']['Message']}"))
+            return art_subnet, f"Client error associating Route Table: {e.response['Error']['Message']}"
         except Exception as e:
-            art_results.append((art_subnet, f"Error associating Route Table: {str(e)}"))
+            return art_subnet, f"Error associating Route Table: {str(e)}"
+
+    # Each association is an independent API call, so overlap the
+    # round-trips; total wall time is ~one RTT instead of one per subnet
+    art_results = []
+    with ThreadPoolExecutor(max_workers=min(16, max(1, len(art_subnets)))) as art_executor:
+        art_futures = [art_executor.submit(art_associate, art_subnet) for art_subnet in art_subnets]
+        for art_future in as_completed(art_futures):
+            art_results.append(art_future.result())
 
     return art_results
 
+def build_association_template(bat_subnet_ids: List[str], bat_rtb_id: str) -> str:
+    """
+    Build a CloudFormation template associating each subnet with the route table.
+
+    Args:
+        bat_subnet_ids: The subnet IDs to associate.
+        bat_rtb_id: The Route Table ID to associate them with.
+
+    Returns:
+        The template body as a JSON string.
+    """
+    bat_resources = {
+        f'Association{bat_index}': {
+            'Type': 'AWS::EC2::SubnetRouteTableAssociation',
+            'Properties': {
+                'SubnetId': bat_subnet_id,
+                'RouteTableId': bat_rtb_id
+            }
+        }
+        for bat_index, bat_subnet_id in enumerate(bat_subnet_ids, start=1)
+    }
+    return json.dumps({
+        'AWSTemplateFormatVersion': '2010-09-09',
+        'Description': 'Route table associations for the AcmeLabs Dev public subnets',
+        'Resources': bat_resources
+    })
+
+def associate_via_stack(avs_subnet_ids: List[str], avs_rtb_id: str) -> Tuple[bool, str]:
+    """
+    Submit every association as a single CloudFormation stack.
+
+    One create_stack request replaces N associate_route_table calls; the
+    associations are applied server-side in parallel and the waiter gives
+    the same synchronous semantics as the direct loop.
+
+    Args:
+        avs_subnet_ids: The subnet IDs to associate.
+        avs_rtb_id: The Route Table ID to associate them with.
+
+    Returns:
+        A tuple of success flag and a status or error message.
+    """
+    avs_cfn = boto3.client('cloudformation')
+    try:
+        avs_cfn.create_stack(
+            StackName=STACK_NAME,
+            TemplateBody=build_association_template(avs_subnet_ids, avs_rtb_id)
+        )
+        avs_cfn.get_waiter('stack_create_complete').wait(StackName=STACK_NAME)
+        return True, (
+            f"Stack '{STACK_NAME}' created: {len(avs_subnet_ids)} subnet(s) "
+            f"associated with {avs_rtb_id}."
+        )
+    except ClientError as e:
+        return False, f"Client error creating association stack: {e.response['Error']['Message']}"
+    except Exception as e:
+        return False, f"Error creating association stack: {str(e)}"
+
 if __name__ == '__main__':
+    ec2 = get_ec2()  # Shared lazy client; built here rather than at import
+
     try:
-        # Get the Route Table ID
-        rtb_id = get_route_table_id(ec2, TAG_RTB)
-        if "Error" in rtb_id:
-            print(rtb_id)
-            exit(1)
+        # The route-table and subnet lookups are independent describes, so
+        # overlap their round-trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rtb_future = executor.submit(get_route_table_id, ec2, TAG_RTB)
+            subnet_future = executor.submit(get_subnet_info, ec2, SUBNET_FILTERS)
 
-        # Get subnet details and IDs
-        subnet_details, subnet_ids = get_subnet_info(ec2, TAG_SUBNET)
-        if isinstance(subnet_ids, str):  # Check if it's an error message
-            print(subnet_ids)
+        # A failed lookup raises out of result(); no sentinel-string scans
+        try:
+            rtb_id = rtb_future.result()
+            subnet_details, subnet_ids = subnet_future.result()
+        except AwsLookupError as e:
+            print(e)
             exit(1)
 
         if not subnet_ids:
             print("No subnets found with the specified tag.")
         else:
-            # Print details of each found subnet
-            for subnet_id in subnet_ids:
-                details = subnet_details[subnet_id]
-                print(f"Subnet Found:\n"
-                      f"    Subnet ID: {subnet_id}\n"
-                      f"    CIDR Block: {details['CIDR Block']}\n"
-                      f"    Availability Zone: {details['Availability Zone']}\n"
-                      f"    VPC ID: {details['VPC ID']}\n")
-
-            # Associate the route table with the subnets
-            response = associate_route_table(ec2, subnet_ids, rtb_id)
-            for subnet_id, result in response:
-                if isinstance(result, dict):
-                    print(
-                        f"Successfully Associated:\n"
-                        f"    RouteTable ID: {rtb_id}\n"
-                        f"    Subnet ID: {subnet_id}"
-                    )
-                else:
-                    print(
-                        f"Failed Association:\n"
-                        f"    RouteTable: {rtb_id}\n"
-                        f"    Subnet ID {subnet_id}: {result}"
-                    )
+            # Buffer the per-subnet report and emit it in one write instead
+            # of a locking, flushing print call per subnet
+            sys.stdout.write(''.join(
+                f"Subnet Found:\n"
+                f"    Subnet ID: {details.subnet_id}\n"
+                f"    CIDR Block: {details.cidr}\n"
+                f"    Availability Zone: {details.az}\n"
+                f"    VPC ID: {details.vpc_id}\n\n"
+                for details in map(subnet_details.__getitem__, subnet_ids)
+            ))
+
+            if '--stack' in sys.argv:
+                # Declarative path: one create_stack call covers every
+                # association; CloudFormation applies them in parallel
+                success, message = associate_via_stack(subnet_ids, rtb_id)
+                print(message)
+                if not success:
+                    exit(1)
+            else:
+                # Direct path: associate the route table with the subnets,
+                # kept for drift repair and accounts without CFN access
+                response = associate_route_table(ec2, subnet_ids, rtb_id)
+                # Same buffering for the association outcomes
+                out = []
+                for subnet_id, result in response:
+                    if isinstance(result, dict):
+                        out.append(
+                            f"Successfully Associated:\n"
+                            f"    RouteTable ID: {rtb_id}\n"
+                            f"    Subnet ID: {subnet_id}\n"
+                        )
+                    else:
+                        out.append(
+                            f"Failed Association:\n"
+                            f"    RouteTable: {rtb_id}\n"
+                            f"    Subnet ID {subnet_id}: {result}\n"
+                        )
+                sys.stdout.write(''.join(out))
 
     except Exception as e:
         print(f"An error occurred in the main execution: {str(e)}")
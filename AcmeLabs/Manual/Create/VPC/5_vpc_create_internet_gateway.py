@@ -1,40 +1,49 @@
 import boto3
 from botocore.exceptions import ClientError
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2
 
 # Constants for internet gateway
 TAG_IGW_NAME = 'AcmeLabs-Dev-IGW'  # Name tag for the Internet Gateway
 TAG_IGW_ENV = 'Dev'  # Environment tag for the Internet Gateway
 
-def internet_gateway_exists(client: boto3.client, igw_tag_name: str, igw_tag_env: str) -> bool:
+# Static describe filters built once from the constants above instead of
+# re-allocating the nested dicts on every lookup
+_IGW_FILTERS = [
+    {'Name': 'tag:Name', 'Values': [TAG_IGW_NAME]},  # Filter by Name tag
+    {'Name': 'tag:Environment', 'Values': [TAG_IGW_ENV]}  # Filter by Environment tag
+]
+
+def find_internet_gateway(client: boto3.client) -> tuple:
     """
-    Check if an Internet Gateway exists with the specified tags.
+    Find an existing Internet Gateway matching this script's tags.
+
+    CreateInternetGateway never rejects a duplicate (gateways are not unique
+    by tag), so this single describe is the only guard against creating one
+    per rerun; returning the matched ID means no caller needs a second
+    lookup to identify the existing gateway.
 
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
-        igw_tag_name (str): The name tag of the Internet Gateway.
-        igw_tag_env (str): The environment tag of the Internet Gateway.
 
     Returns:
-        bool: True if the Internet Gateway exists, False otherwise.
+        tuple: (str, str) containing the existing Internet Gateway ID (empty
+        if none) and an error message if applicable.
     """
     try:
-        # Describe Internet Gateways with specified filters
-        igw_response = client.describe_internet_gateways(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [igw_tag_name]},
-                {'Name': 'tag:Environment', 'Values': [igw_tag_env]}
-            ]
+        # Describe Internet Gateways with specified filters, stopping at the
+        # first match instead of fetching the full list
+        fig_pages = client.get_paginator('describe_internet_gateways').paginate(
+            Filters=_IGW_FILTERS,
+            PaginationConfig={'MaxItems': 1, 'PageSize': 5}
         )
-
-        # Return True if any Internet Gateways match the filters
-        return len(igw_response['InternetGateways']) > 0
-
+        # Return the ID of the first matching Internet Gateway, if any
+        for fig_page in fig_pages:
+            if fig_page['InternetGateways']:
+                return (fig_page['InternetGateways'][0]['InternetGatewayId'], "")
+        return ("", "")
     except ClientError as e:
-        print(f"Error checking Internet Gateway existence: {e.response['Error']['Message']}")
-        return False  # Return False on error
+        return ("", f"Error checking Internet Gateway existence: {e.response['Error']['Message']}")
 
 def create_internet_gateway(client: boto3.client) -> str:
     """
@@ -70,12 +79,20 @@ def create_internet_gateway(client: boto3.client) -> str:
         return f"Error creating Internet Gateway: {e.response['Error']['Message']}"
 
 if __name__ == '__main__':
-    # Check if the Internet Gateway already exists
-    exists = internet_gateway_exists(ec2, TAG_IGW_NAME, TAG_IGW_ENV)
+    ec2 = get_ec2()  # Shared lazy client; built here rather than at import
+
+    # Check if the Internet Gateway already exists; the same call surfaces
+    # its ID so a rerun reports the gateway instead of just its tags
+    existing_igw_id, find_error = find_internet_gateway(ec2)
+
+    if find_error:
+        print(find_error)
+        exit(1)  # Don't risk a duplicate create when the lookup itself failed
 
-    if exists:
+    if existing_igw_id:
         print(
-            f"Internet Gateway Exits:\n"
+            f"Internet Gateway Exists:\n"
+            f"    ID: {existing_igw_id}\n"
             f"    Name: {TAG_IGW_NAME}\n"
             f"    Environment: {TAG_IGW_ENV}"
         )
@@ -2,69 +2,57 @@ import boto3
 from botocore.exceptions import ClientError
 from typing import Tuple, Optional, Any
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2, get_tagging
 
 # Constants for internet gateway attachment
 TAG_VPC_NAME = 'AcmeLabs-Dev'  # Name tag for the VPC
 TAG_IGW_NAME = 'AcmeLabs-Dev-IGW'  # Name tag for the Internet Gateway
 TAG_IGW_ENV = 'Dev'  # Environment tag for the Internet Gateway
 
-def get_vpc_id(client: boto3.client) -> Tuple[Optional[str], Optional[str]]:
-    """
-    Check if a VPC exists with the specified name tag 'AcmeLabs-Dev'.
-    If it exists, return the VPC ID.
-
-    Args:
-        client (boto3.client): The EC2 client used to interact with AWS.
+# Static GetResources arguments built once from the constants above instead
+# of re-allocating the nested dicts on every lookup
+_VPC_IGW_TAG_FILTERS = [
+    {'Key': 'Name', 'Values': [TAG_VPC_NAME, TAG_IGW_NAME]},
+    {'Key': 'Environment', 'Values': [TAG_IGW_ENV]}
+]
+_VPC_IGW_TYPE_FILTERS = ['ec2:vpc', 'ec2:internet-gateway']
 
-    Returns:
-        Tuple[Optional[str], Optional[str]]: The VPC ID if the VPC exists, or an error message.
+def fetch_vpc_and_igw(client: boto3.client) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
-    try:
-        # Describe VPCs based on the provided filters
-        gvi_response = client.describe_vpcs(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [TAG_VPC_NAME]},  # Filter by Name tag
-                {'Name': 'tag:Environment', 'Values': [TAG_IGW_ENV]}  # Filter by Environment tag
-            ]
-        )
+    Resolve the tagged VPC and Internet Gateway in a single call.
 
-        # Check if any VPCs match the filters and return the VPC ID
-        if gvi_response['Vpcs']:
-            return gvi_response['Vpcs'][0]['VpcId'], None  # Return the VPC ID of the first matching VPC
-        else:
-            return None, "No matching VPC found."  # No matching VPC found
-    except ClientError as e:
-        return None, f"Error checking VPC existence: {e}"  # Return error message
-
-def get_internet_gateway_id(client: boto3.client, gigi_tag_name: str) -> Tuple[Optional[str], Optional[str]]:
-    """
-    Check if an Internet Gateway exists with the specified name tag.
-    If it exists, return the Internet Gateway ID.
+    The Tagging API returns every matching resource at once, so the two
+    separate describe_vpcs/describe_internet_gateways round-trips collapse
+    into one request; the IDs are then split out of the ARNs locally.
 
     Args:
-        client (boto3.client): The EC2 client used to interact with AWS.
-        gigi_tag_name (str): The name of the tag to filter the Internet Gateway.
+        client (boto3.client): The Resource Groups Tagging API client.
 
     Returns:
-        Tuple[Optional[str], Optional[str]]: The Internet Gateway ID if it exists, or an error message.
+        Tuple[Optional[str], Optional[str], Optional[str]]: The VPC ID, the
+        Internet Gateway ID, and an error message if the lookup failed.
     """
     try:
-        # Describe Internet Gateways based on the provided filters
-        gigi_response = client.describe_internet_gateways(
-            Filters=[
-                {'Name': 'tag:Name', 'Values': [gigi_tag_name]}  # Filter by Name tag
-            ]
+        # One GetResources covers both Name tags, narrowed by resource type
+        # and the shared Environment tag
+        fvi_response = client.get_resources(
+            TagFilters=_VPC_IGW_TAG_FILTERS,
+            ResourceTypeFilters=_VPC_IGW_TYPE_FILTERS
         )
 
-        # Check if any Internet Gateways match the filters and return the first one found
-        if gigi_response['InternetGateways']:
-            return gigi_response['InternetGateways'][0]['InternetGatewayId'], None
-        else:
-            return None, "No Internet Gateway found with the specified tag."
+        fvi_vpc_id = None
+        fvi_igw_id = None
+        # Dispatch each match by its ARN's resource type; the ID is the
+        # final path segment of the ARN
+        for fvi_resource in fvi_response['ResourceTagMappingList']:
+            fvi_arn = fvi_resource['ResourceARN']
+            if ':vpc/' in fvi_arn:
+                fvi_vpc_id = fvi_arn.rsplit('/', 1)[-1]
+            elif ':internet-gateway/' in fvi_arn:
+                fvi_igw_id = fvi_arn.rsplit('/', 1)[-1]
+        return fvi_vpc_id, fvi_igw_id, None
     except ClientError as e:
-        return None, f"Error checking Internet Gateway existence: {e}"  # Return error message
+        return None, None, f"Error retrieving tagged resources: {e}"
 
 def attach_internet_gateway(client: boto3.client, aig_vpc_id: str, aig_igw_id: str) -> Tuple[bool, Optional[str]]:
     """
@@ -89,17 +77,20 @@ def attach_internet_gateway(client: boto3.client, aig_vpc_id: str, aig_igw_id: s
         return False, f"Error attaching Internet Gateway: {e}"  # Return error message
 
 if __name__ == "__main__":
-    # Get VPC ID
-    vpc_id, error = get_vpc_id(ec2)
+    ec2 = get_ec2()  # Shared lazy clients; built here rather than at import
+    rg = get_tagging()
+
+    # Resolve both tagged resources with a single Tagging API round-trip
+    vpc_id, igw_id, error = fetch_vpc_and_igw(rg)
     if error:
-        print(error)  # Print error message for VPC ID retrieval
+        print(error)  # Print error message for the combined lookup
+    elif not vpc_id:
+        print("No matching VPC found.")
     else:
         print(f"VPC ID: {vpc_id}")
 
-        # Get Internet Gateway ID based on the tag name
-        igw_id, error = get_internet_gateway_id(ec2, TAG_IGW_NAME)
-        if error:
-            print(error)  # Print error message for Internet Gateway ID retrieval
+        if not igw_id:
+            print("No Internet Gateway found with the specified tag.")
         else:
             print(f"Internet Gateway ID: {igw_id}")
 
@@ -1,70 +1,66 @@
 import boto3
-import botocore.exceptions as ClientError
-from typing import Tuple, Optional, Union
+from typing import NamedTuple, Tuple, Optional
 
-# Initialize the EC2 client
-ec2 = boto3.client('ec2')
+from clients import get_ec2, get_tagging
 
 # Constants for route creation
 TAG_IGW_NAME = 'AcmeLabs-Dev-IGW'  # Name tag for the Internet Gateway
 TAG_RTB = 'AcmeLabs-Dev-RouteTable'  # Name tag for the Route Table
 DEST_CIDR_BLOCK = '0.0.0.0/0'  # Destination CIDR block for the route
 
-def get_internet_gateway_id(client: boto3.client, gigi_tag_name: str) -> Tuple[Optional[str], Optional[str]]:
-    """
-    Check if an Internet Gateway exists with the specified name tag.
+# Static GetResources arguments built once from the constants above instead
+# of re-allocating the nested dicts on every lookup
+_ROUTE_TAG_FILTERS = [
+    {'Key': 'Name', 'Values': [TAG_IGW_NAME, TAG_RTB]}
+]
+_ROUTE_TYPE_FILTERS = ['ec2:internet-gateway', 'ec2:route-table']
 
-    Args:
-        client (boto3.client): The EC2 client used to interact with AWS.
-        gigi_tag_name (str): The name of the tag to filter the Internet Gateway.
+class LookupResult(NamedTuple):
+    """Outcome of an AWS call: the value on success, the message on failure.
 
-    Returns:
-        Tuple[Optional[str], Optional[str]]: The Internet Gateway ID if it exists, or an error message.
+    Exactly one field is set, so callers branch on a single attribute load
+    instead of isinstance checks against a value-or-message union.
     """
-    try:
-        # Describe Internet Gateways based on the provided filters
-        gigi_response = client.describe_internet_gateways(
-            Filters=[{'Name': 'tag:Name', 'Values': [gigi_tag_name]}]  # Filter by Name tag
-        )
-
-        # Check if any Internet Gateways match the filters and return the first one found
-        if gigi_response['InternetGateways']:
-            return gigi_response['InternetGateways'][0]['InternetGatewayId'], None
-        else:
-            return None, "No Internet Gateway found with the specified tag."
-    except ClientError as e:
-        return None, f"Error checking Internet Gateway existence: {e}"
-    except Exception as e:
-        return None, f"Unexpected error: {str(e)}"
+    value: Optional[str]
+    error: Optional[str]
 
-def get_route_table_id(client: boto3.client, grti_rtb_tag: str) -> Union[str, str]:
+def get_resources_by_tag(client: boto3.client) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
-    Retrieve the Route Table ID based on the given tag.
+    Resolve the tagged Internet Gateway and Route Table in a single call.
+
+    The Tagging API returns every matching resource at once, so the two
+    separate describe_internet_gateways/describe_route_tables round-trips
+    collapse into one request; the IDs are then split out of the ARNs locally.
 
     Args:
-        client (boto3.client): The EC2 client used to interact with AWS.
-        grti_rtb_tag (str): The tag name of the route table to retrieve.
+        client (boto3.client): The Resource Groups Tagging API client.
 
     Returns:
-        Union[str, str]: The Route Table ID or an error message.
+        Tuple[Optional[str], Optional[str], Optional[str]]: The Internet Gateway ID,
+        the Route Table ID, and an error message if the lookup failed.
     """
     try:
-        # Describe route tables with the specified tag
-        grti_response = client.describe_route_tables(
-            Filters=[{'Name': 'tag:Name', 'Values': [grti_rtb_tag]}]
+        # One GetResources covers both Name tags, narrowed by resource type
+        grbt_response = client.get_resources(
+            TagFilters=_ROUTE_TAG_FILTERS,
+            ResourceTypeFilters=_ROUTE_TYPE_FILTERS
         )
 
-        # Check if any route tables were found
-        if grti_response['RouteTables']:
-            return grti_response['RouteTables'][0]['RouteTableId']
-        else:
-            return f"No route table found with tag: {grti_rtb_tag}"
-    except ClientError as e:
-        return f"Client error retrieving route table ID: {e.response['Error']['Message']}"
+        grbt_igw_id = None
+        grbt_rtb_id = None
+        # Dispatch each match by its ARN's resource type; the ID is the
+        # final path segment of the ARN
+        for grbt_resource in grbt_response['ResourceTagMappingList']:
+            grbt_arn = grbt_resource['ResourceARN']
+            if ':internet-gateway/' in grbt_arn:
+                grbt_igw_id = grbt_arn.rsplit('/', 1)[-1]
+            elif ':route-table/' in grbt_arn:
+                grbt_rtb_id = grbt_arn.rsplit('/', 1)[-1]
+        return grbt_igw_id, grbt_rtb_id, None
     except Exception as e:
-        return f"Error retrieving route table ID: {str(e)}"
+        return None, None, f"Error retrieving tagged resources: {str(e)}"
 
-def create_route(client: boto3.client, cr_dest_cidr_block: str, cr_igw_id: str, cr_rtb_id: str) -> Union[Tuple[Optional[str], Optional[str]], str]:
+def create_route(client: boto3.client, cr_dest_cidr_block: str, cr_igw_id: str, cr_rtb_id: str) -> LookupResult:
     """
     Create a route in the specified route table to direct traffic to the Internet Gateway.
 
@@ -75,7 +71,7 @@ def create_route(client: boto3.client, cr_dest_cidr_block: str, cr_igw_id: str,
         cr_rtb_id (str): The Route Table ID.
 
     Returns:
-        Union[Tuple[Optional[str], Optional[str]], str]: The Route Table ID or an error message.
+        LookupResult: The Route Table ID on success, or an error message.
     """
     try:
         # Create a route in the specified route table
@@ -85,32 +81,35 @@ def create_route(client: boto3.client, cr_dest_cidr_block: str, cr_igw_id: str,
             RouteTableId=cr_rtb_id
         )
         if cr_response['Return']:
-            return cr_rtb_id, None
+            return LookupResult(cr_rtb_id, None)
         else:
-            return None, "Route creation failed, no RouteTableId returned."
-    except ClientError as e:
-        return None, f"Error creating route: {e.response['Error']['Message']}"
+            return LookupResult(None, "Route creation failed, no RouteTableId returned.")
     except Exception as e:
-        return None, f"Error creating route: {str(e)}"
+        return LookupResult(None, f"Error creating route: {str(e)}")
 
 if __name__ == "__main__":
-    # Get the Internet Gateway ID based on the specified tag
-    igw_id, error = get_internet_gateway_id(ec2, TAG_IGW_NAME)
+    ec2 = get_ec2()  # Shared lazy clients; built here rather than at import
+    rg = get_tagging()
+
+    # Resolve both tagged resources with a single Tagging API round-trip
+    igw_id, rtb_id, error = get_resources_by_tag(rg)
     if error:
         print(error)
     else:
-        print(f"Internet Gateway ID: {igw_id}")
-
-    # Get the Route Table ID based on the specified tag
-    rtb_id = get_route_table_id(ec2, TAG_RTB)
-    if isinstance(rtb_id, str) and "No route table found" in rtb_id:
-        print(rtb_id)
-    else:
-        print(f"Route Table ID: {rtb_id}")
+        if igw_id:
+            print(f"Internet Gateway ID: {igw_id}")
+        else:
+            print("No Internet Gateway found with the specified tag.")
 
-    # Create a route in the Route Table to direct traffic to the Internet Gateway
-    route_result = create_route(ec2, DEST_CIDR_BLOCK, igw_id, rtb_id)
-    if isinstance(route_result, tuple) and route_result[1]:
-        print(route_result[1])  # Print error if route creation fails
-    else:
-        print(f"Route created successfully in Route Table ID: {route_result[0]}")
+        if rtb_id:
+            print(f"Route Table ID: {rtb_id}")
+        else:
+            print(f"No route table found with tag: {TAG_RTB}")
+
+        # Only create the route once both resources resolved
+        if igw_id and rtb_id:
+            route_result = create_route(ec2, DEST_CIDR_BLOCK, igw_id, rtb_id)
+            if route_result.error:
+                print(route_result.error)  # Print error if route creation fails
+            else:
+                print(f"Route created successfully in Route Table ID: {route_result.value}")
@@ -0,0 +1,49 @@
+import time
+from typing import Any, Dict, List, Tuple
+
+import boto3
+
+# How long a cached describe answer stays fresh. Route tables change rarely
+# and AWS Describe* responses are safe to reuse for tens of seconds, so a
+# short TTL removes redundant calls without risking stale decisions.
+_TTL_SECONDS = 30.0
+
+# Cached responses keyed by tag value; the client is a per-process singleton
+# in these scripts, so the tag alone identifies the query
+_route_table_cache: Dict[str, Tuple[float, List[Any]]] = {}
+
+def describe_route_tables_by_tag(client: boto3.client, drtbt_tag: str) -> List[Any]:
+    """
+    Return the route tables whose Name tag matches, caching the answer.
+
+    The same tag-filtered describe_route_tables call is issued by several
+    scripts in this tree; within one process (or an orchestrator importing
+    them back to back) repeat lookups inside the TTL answer from memory
+    instead of costing another EC2 round-trip.
+
+    Args:
+        client (boto3.client): The EC2 client used to interact with AWS.
+        drtbt_tag (str): The Name tag value of the route tables to describe.
+
+    Returns:
+        List[Any]: The matching RouteTables entries, possibly empty.
+
+    Raises:
+        botocore.exceptions.ClientError: If the describe call fails; errors
+            are never cached, so a retry goes back to the API.
+    """
+    drtbt_now = time.monotonic()
+    drtbt_hit = _route_table_cache.get(drtbt_tag)
+    if drtbt_hit is not None and drtbt_now - drtbt_hit[0] < _TTL_SECONDS:
+        return drtbt_hit[1]  # Fresh enough; no API call needed
+
+    # Paginate so matches past the first page still surface on large
+    # accounts; PageSize 100 is the describe_route_tables maximum
+    drtbt_tables = []
+    for drtbt_page in client.get_paginator('describe_route_tables').paginate(
+        Filters=[{'Name': 'tag:Name', 'Values': [drtbt_tag]}],
+        PaginationConfig={'PageSize': 100}
+    ):
+        drtbt_tables.extend(drtbt_page['RouteTables'])
+    _route_table_cache[drtbt_tag] = (drtbt_now, drtbt_tables)
+    return drtbt_tables
@@ -0,0 +1,37 @@
+import boto3
+from botocore.config import Config
+import functools
+
+# Shared client settings: adaptive retries back off before throttling hits,
+# the pool covers the concurrent calls the scripts issue, and keep-alive
+# reuses warm connections between calls
+CFG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=32,
+    tcp_keepalive=True
+)
+
+@functools.lru_cache(maxsize=None)
+def get_ec2() -> boto3.client:
+    """
+    Return the shared EC2 client, building it on first use.
+
+    Every script in this directory previously constructed its own client,
+    re-running botocore's service-model parse, endpoint resolution and
+    credential-chain walk per process. The cached factory pays those costs
+    once, and an orchestrator importing several scripts shares one client.
+
+    Returns:
+        boto3.client: The shared EC2 client.
+    """
+    return boto3.client('ec2', config=CFG)
+
+@functools.lru_cache(maxsize=None)
+def get_tagging() -> boto3.client:
+    """
+    Return the shared Resource Groups Tagging API client, building it on first use.
+
+    Returns:
+        boto3.client: The shared Tagging API client.
+    """
+    return boto3.client('resourcegroupstaggingapi', config=CFG)
@@ -0,0 +1,147 @@
+import boto3
+from botocore.exceptions import ClientError
+from typing import Optional, Tuple
+import json
+
+from clients import get_tagging
+
+# Constants for the fused network deployment
+TAG_VPC_NAME = 'AcmeLabs-Dev'  # Name tag for the VPC
+TAG_IGW_NAME = 'AcmeLabs-Dev-IGW'  # Name tag for the Internet Gateway
+TAG_IGW_ENV = 'Dev'  # Environment tag for the Internet Gateway
+TAG_RTB = 'AcmeLabs-Dev-RouteTable'  # Name tag for the Route Table
+DEST_CIDR_BLOCK = '0.0.0.0/0'  # Destination CIDR block for the route
+STACK_NAME = 'acme-dev-vpc-net'  # CloudFormation stack holding the IGW, attachment and route
+
+# Static GetResources arguments built once from the constants above
+_NET_TAG_FILTERS = [
+    {'Key': 'Name', 'Values': [TAG_VPC_NAME, TAG_RTB]}
+]
+_NET_TYPE_FILTERS = ['ec2:vpc', 'ec2:route-table']
+
+def fetch_vpc_and_rtb(client: boto3.client) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Resolve the tagged VPC and Route Table in a single call.
+
+    Args:
+        client (boto3.client): The Resource Groups Tagging API client.
+
+    Returns:
+        Tuple[Optional[str], Optional[str], Optional[str]]: The VPC ID, the
+        Route Table ID, and an error message if the lookup failed.
+    """
+    try:
+        fvr_response = client.get_resources(
+            TagFilters=_NET_TAG_FILTERS,
+            ResourceTypeFilters=_NET_TYPE_FILTERS
+        )
+
+        fvr_vpc_id = None
+        fvr_rtb_id = None
+        # Dispatch each match by its ARN's resource type; the ID is the
+        # final path segment of the ARN
+        for fvr_resource in fvr_response['ResourceTagMappingList']:
+            fvr_arn = fvr_resource['ResourceARN']
+            if ':vpc/' in fvr_arn:
+                fvr_vpc_id = fvr_arn.rsplit('/', 1)[-1]
+            elif ':route-table/' in fvr_arn:
+                fvr_rtb_id = fvr_arn.rsplit('/', 1)[-1]
+        return fvr_vpc_id, fvr_rtb_id, None
+    except ClientError as e:
+        return None, None, f"Error retrieving tagged resources: {e}"
+
+def build_network_template(bnt_vpc_id: str, bnt_rtb_id: str) -> str:
+    """
+    Build the CloudFormation template fusing IGW create, attach and route.
+
+    The three mutating calls the step scripts issue (create_internet_gateway,
+    attach_internet_gateway, create_route) become one declarative submission;
+    CloudFormation orders the steps server-side via DependsOn.
+
+    Args:
+        bnt_vpc_id: The ID of the existing VPC to attach the gateway to.
+        bnt_rtb_id: The ID of the existing route table to route through it.
+
+    Returns:
+        The template body as a JSON string.
+    """
+    return json.dumps({
+        'AWSTemplateFormatVersion': '2010-09-09',
+        'Description': 'Internet gateway, attachment and default route for the AcmeLabs Dev VPC',
+        'Resources': {
+            'InternetGateway': {
+                'Type': 'AWS::EC2::InternetGateway',
+                'Properties': {
+                    'Tags': [
+                        {'Key': 'Name', 'Value': TAG_IGW_NAME},
+                        {'Key': 'Environment', 'Value': TAG_IGW_ENV}
+                    ]
+                }
+            },
+            'AttachGateway': {
+                'Type': 'AWS::EC2::VPCGatewayAttachment',
+                'Properties': {
+                    'VpcId': bnt_vpc_id,
+                    'InternetGatewayId': {'Ref': 'InternetGateway'}
+                }
+            },
+            'PublicRoute': {
+                'Type': 'AWS::EC2::Route',
+                # The route is only valid once the gateway is attached
+                'DependsOn': 'AttachGateway',
+                'Properties': {
+                    'RouteTableId': bnt_rtb_id,
+                    'DestinationCidrBlock': DEST_CIDR_BLOCK,
+                    'GatewayId': {'Ref': 'InternetGateway'}
+                }
+            }
+        }
+    })
+
+def create_network_stack(cns_vpc_id: str, cns_rtb_id: str) -> Tuple[bool, str]:
+    """
+    Submit the fused network resources as a single CloudFormation stack.
+
+    Args:
+        cns_vpc_id: The ID of the existing VPC.
+        cns_rtb_id: The ID of the existing route table.
+
+    Returns:
+        A tuple of success flag and a status or error message.
+    """
+    cns_cfn = boto3.client('cloudformation')
+    try:
+        # CloudFormation orders and parallelizes the resource creation
+        # server-side, so the client pays a single create round trip
+        cns_cfn.create_stack(
+            StackName=STACK_NAME,
+            TemplateBody=build_network_template(cns_vpc_id, cns_rtb_id)
+        )
+        cns_cfn.get_waiter('stack_create_complete').wait(StackName=STACK_NAME)
+        return True, (
+            f"Stack '{STACK_NAME}' created: Internet Gateway attached to "
+            f"{cns_vpc_id} with a {DEST_CIDR_BLOCK} route in {cns_rtb_id}."
+        )
+    except ClientError as e:
+        return False, f"Error creating network stack: {e.response['Error']['Message']}"
+
+if __name__ == '__main__':
+    rg = get_tagging()  # Shared lazy client; built here rather than at import
+
+    # Resolve both existing resources with a single Tagging API round-trip
+    vpc_id, rtb_id, error = fetch_vpc_and_rtb(rg)
+    if error:
+        print(error)
+        exit(1)
+    if not vpc_id:
+        print("No matching VPC found.")
+        exit(1)
+    if not rtb_id:
+        print(f"No route table found with tag: {TAG_RTB}")
+        exit(1)
+
+    # One create_stack replaces the IGW create, attach and route scripts
+    success, message = create_network_stack(vpc_id, rtb_id)
+    print(message)
+    if not success:
+        exit(1)
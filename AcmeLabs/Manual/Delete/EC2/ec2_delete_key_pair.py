@@ -1,9 +1,20 @@
+import argparse
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, Any
+import sys
+
+# Shared client settings: adaptive retries back off before throttling hits
+# and keep-alive reuses the warm connection across the script's calls
+CFG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=32,
+    tcp_keepalive=True
+)
 
 # Initialize the EC2 client
-ec2 = boto3.client('ec2')
+ec2 = boto3.client('ec2', config=CFG)
 
 def delete_key_pair(client: boto3.client, dkp_key_name: str = None, dkp_key_id: str = None) -> Dict[str, Any]:
     """
@@ -57,12 +68,16 @@ def prompt_with_retries(pwr_prompt: str, pwr_max_retries: int = 3) -> str:
     """
     pwr_retries = 0
     while pwr_retries < pwr_max_retries:
-        pwr_response = input(pwr_prompt).strip()
+        sys.stdout.write(pwr_prompt)
+        sys.stdout.flush()
+        pwr_response = sys.stdin.readline()
+        if not pwr_response:  # EOF: stdin closed, no more input will come
+            break
+        pwr_response = pwr_response.strip()
         if pwr_response:
             return pwr_response
-        else:
-            pwr_retries += 1
-            print(f"No input provided. You have {pwr_max_retries - pwr_retries} retry(s) left.")
+        pwr_retries += 1
+        print(f"No input provided. You have {pwr_max_retries - pwr_retries} retry(s) left.")
 
     # Raise an exception if maximum retries reached
     raise Exception("Maximum retries reached. Exiting the program.")
@@ -83,17 +98,28 @@ def get_key_input_type() -> str:
             print("Invalid choice. Please enter 'name' for Key Name or 'id' for Key ID.")
 
 if __name__ == "__main__":
+    # Scripted runs pass the key on argv and skip the prompts entirely;
+    # the interactive flow below only runs when neither flag is given
+    parser = argparse.ArgumentParser(description='Delete an EC2 key pair.')
+    parser.add_argument('--name', help='Name of the key pair to delete')
+    parser.add_argument('--id', help='ID of the key pair to delete')
+    args = parser.parse_args()
+
     try:
-        # Prompt for key input type
-        key_input_type = get_key_input_type()
-
-        # Based on the choice, prompt for the appropriate key
-        if key_input_type == 'name':
-            key_name = prompt_with_retries("Enter the key pair name: ")
-            key_id = ""  # No key ID needed if using key name
-        else:  # key_input_type == 'id'
-            key_name = ""
-            key_id = prompt_with_retries("Enter the key pair ID: ")
+        if args.name or args.id:
+            key_name = args.name or ""
+            key_id = args.id or ""
+        else:
+            # Prompt for key input type
+            key_input_type = get_key_input_type()
+
+            # Based on the choice, prompt for the appropriate key
+            if key_input_type == 'name':
+                key_name = prompt_with_retries("Enter the key pair name: ")
+                key_id = ""  # No key ID needed if using key name
+            else:  # key_input_type == 'id'
+                key_name = ""
+                key_id = prompt_with_retries("Enter the key pair ID: ")
 
         # Call the function and handle the result
         result = delete_key_pair(ec2, key_name if key_name else None, key_id if key_id else None)
@@ -1,9 +1,20 @@
+import argparse
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing import Dict, Any
+import sys
+
+# Shared client settings: adaptive retries back off before throttling hits
+# and keep-alive reuses the warm connection across the script's calls
+CFG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=32,
+    tcp_keepalive=True
+)
 
 # Initialize the EC2 client
-ec2 = boto3.client('ec2')
+ec2 = boto3.client('ec2', config=CFG)
 
 def get_security_group_id_by_name(client: boto3.client, gsgibn_tag_name: str) -> str:
     """
@@ -16,15 +27,23 @@ def get_security_group_id_by_name(client: boto3.client, gsgibn_tag_name: str) ->
     Returns:
         str: The security group ID if found, else None.
     """
-    try:
-        gsgibn_response = client.describe_security_groups(Filters=[{
-            'Name': 'tag:Name',
-            'Values': [gsgibn_tag_name]
-        }])
+    # Input that is already an ID needs no lookup; skip the describe entirely
+    if gsgibn_tag_name.startswith('sg-'):
+        return gsgibn_tag_name
 
-        gsgibn_security_groups = gsgibn_response.get('SecurityGroups', [])
-        if gsgibn_security_groups:
-            return gsgibn_security_groups[0]['GroupId']  # Return the first matching security group ID
+    try:
+        # Stop at the first match instead of fetching every security group
+        gsgibn_pages = client.get_paginator('describe_security_groups').paginate(
+            Filters=[{
+                'Name': 'tag:Name',
+                'Values': [gsgibn_tag_name]
+            }],
+            PaginationConfig={'MaxItems': 1, 'PageSize': 5}
+        )
+        for gsgibn_page in gsgibn_pages:
+            gsgibn_security_groups = gsgibn_page.get('SecurityGroups', [])
+            if gsgibn_security_groups:
+                return gsgibn_security_groups[0]['GroupId']  # Return the first matching security group ID
 
     except ClientError as e:
         print(f"An error occurred: {e}")
@@ -62,28 +81,44 @@ def delete_security_group(client: boto3.client, dsg_group_id: str) -> Dict[str,
 def prompt_with_retries(pwr_prompt: str, pwr_max_retries: int = 3) -> str:
     pwr_retries = 0
     while pwr_retries < pwr_max_retries:
-        pwr_response = input(pwr_prompt).strip()
+        sys.stdout.write(pwr_prompt)
+        sys.stdout.flush()
+        pwr_response = sys.stdin.readline()
+        if not pwr_response:  # EOF: stdin closed, no more input will come
+            break
+        pwr_response = pwr_response.strip()
         if pwr_response:
             return pwr_response
-        else:
-            pwr_retries += 1
-            print(f"No input provided. You have {pwr_max_retries - pwr_retries} retry(s) left.")
+        pwr_retries += 1
+        print(f"No input provided. You have {pwr_max_retries - pwr_retries} retry(s) left.")
 
     raise Exception("Maximum retries reached. Exiting the program.")
 
 if __name__ == "__main__":
+    # Scripted runs pass the group on argv and skip the prompts entirely;
+    # the interactive flow below only runs when neither flag is given
+    parser = argparse.ArgumentParser(description='Delete an EC2 security group.')
+    parser.add_argument('--name', help='Name tag of the security group (default VPC)')
+    parser.add_argument('--id', help='ID of the security group to delete')
+    args = parser.parse_args()
+
     try:
-        # Ask if the security group is in the default VPC
-        is_default_vpc = prompt_with_retries("Is the security group in the default VPC? (yes/no): ").strip().lower()
-
-        if is_default_vpc == 'yes':
-            # Prompt for the security group name or ID
-            group_input = prompt_with_retries("Enter the security group Name or ID to delete: ")
-            # Check if it's a valid ID (assuming IDs are in the format 'sg-xxxxxxxx')
-            group_id = group_input if group_input.startswith('sg-') else get_security_group_id_by_name(ec2, group_input)
+        if args.id:
+            group_id = args.id
+        elif args.name:
+            group_id = get_security_group_id_by_name(ec2, args.name)
         else:
-            # If not in the default VPC, we must use the group ID
-            group_id = prompt_with_retries("Enter the security group ID to delete: ")
+            # Ask if the security group is in the default VPC
+            is_default_vpc = prompt_with_retries("Is the security group in the default VPC? (yes/no): ").strip().lower()
+
+            if is_default_vpc == 'yes':
+                # Prompt for the security group name or ID; the helper
+                # short-circuits when the input is already an ID
+                group_input = prompt_with_retries("Enter the security group Name or ID to delete: ")
+                group_id = get_security_group_id_by_name(ec2, group_input)
+            else:
+                # If not in the default VPC, we must use the group ID
+                group_id = prompt_with_retries("Enter the security group ID to delete: ")
 
         # Call the function to delete the security group
         result = delete_security_group(ec2, group_id)
@@ -1,18 +1,58 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Union
+from typing import Dict, Union
+import json
+import os
+
+# Shared client settings: adaptive retries back off before throttling hits
+# and keep-alive reuses the warm connection across the script's calls
+CFG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=32,
+    tcp_keepalive=True
+)
 
 # Initialize the EC2 client
-ec2 = boto3.client('ec2')
+ec2 = boto3.client('ec2', config=CFG)
 
 # Constants for route deletion
 TAG_RTB = 'AcmeLabs-Dev-RouteTable'  # Name tag for the Route Table
 DEST_CIDR_BLOCK = '0.0.0.0/0'  # Destination CIDR block for the route
+RTB_CACHE_FILE = os.path.expanduser('~/.cache/acmelabs/route_tables.json')
+
+def load_rtb_cache() -> Dict[str, str]:
+    """
+    Load the local cache of route table IDs keyed by Name tag.
+
+    Returns:
+        Dict[str, str]: The tag-to-RouteTableId mapping; empty if no cache exists yet.
+    """
+    try:
+        with open(RTB_CACHE_FILE) as lrc_file:
+            return json.load(lrc_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_rtb_cache(src_cache: Dict[str, str]) -> None:
+    """
+    Persist the local cache of route table IDs.
+
+    Args:
+        src_cache (Dict[str, str]): The tag-to-RouteTableId mapping to write.
+    """
+    os.makedirs(os.path.dirname(RTB_CACHE_FILE), exist_ok=True)
+    with open(RTB_CACHE_FILE, 'w') as src_file:
+        json.dump(src_cache, src_file)
 
 def get_route_table_id(client: boto3.client, grt_rtb_tag: str) -> Union[str, str]:
     """
     Retrieve the Route Table ID based on the given tag.
 
+    An ID remembered from a previous run turns the tag scan into a direct
+    RouteTableIds lookup, which EC2 serves without walking the account's tag
+    index; stale entries are dropped and fall back to the tag filter.
+
     Args:
         client (boto3.client): The EC2 client used to interact with AWS.
         grt_rtb_tag (str): The tag name of the route table to retrieve.
@@ -20,6 +60,21 @@ def get_route_table_id(client: boto3.client, grt_rtb_tag: str) -> Union[str, str
     Returns:
         Union[str, str]: The Route Table ID or an error message.
     """
+    grt_cache = load_rtb_cache()
+    grt_cached_id = grt_cache.get(grt_rtb_tag)
+    if grt_cached_id:
+        try:
+            # Cheap direct lookup by ID to confirm the table still exists
+            grt_response = client.describe_route_tables(RouteTableIds=[grt_cached_id])
+            if grt_response['RouteTables']:
+                return grt_cached_id
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'InvalidRouteTableID.NotFound':
+                return f"Client error retrieving route table ID: {e.response['Error']['Message']}"
+            # The cached table is gone; drop the entry and re-resolve by tag
+            grt_cache.pop(grt_rtb_tag, None)
+            save_rtb_cache(grt_cache)
+
     try:
         # Describe route tables with the specified tag
         grt_response = client.describe_route_tables(
@@ -32,7 +87,11 @@ def get_route_table_id(client: boto3.client, grt_rtb_tag: str) -> Union[str, str
         )
         # Check if any route tables were found
         if grt_response['RouteTables']:
-            return grt_response['RouteTables'][0]['RouteTableId']
+            grt_rtb_id = grt_response['RouteTables'][0]['RouteTableId']
+            # Remember the ID so the next run skips the tag scan
+            grt_cache[grt_rtb_tag] = grt_rtb_id
+            save_rtb_cache(grt_cache)
+            return grt_rtb_id
         else:
             return f"No route table found with tag: {grt_rtb_tag}"
     except ClientError as e:
@@ -42,12 +42,16 @@ def filter_subnets_by_name(fsbn_subnets: List[Dict[str, Any]], fsbn_name_filter:
     Returns:
         A list of subnets that match the name filter.
     """
+    # Lower the pattern and bind the matcher once, outside the loop, instead
+    # of re-doing both for every subnet
+    fsbn_pattern = fsbn_name_filter.lower()
+    fsbn_match = fnmatch.fnmatchcase
     fsbn_filtered_subnets = []
     for fsbn_subnet in fsbn_subnets:
         # Extract the subnet name from the tags
-        fsbn_subnet_name = next((tag['Value'] for tag in fsbn_subnet.get('Tags', []) if tag['Key'] == 'Name'), None)
+        fsbn_subnet_name = next((tag['Value'] for tag in fsbn_subnet.get('Tags', ()) if tag['Key'] == 'Name'), None)
         # Check if the subnet name matches the provided filter
-        if fsbn_subnet_name and fnmatch.fnmatchcase(fsbn_subnet_name.lower(), fsbn_name_filter.lower()):
+        if fsbn_subnet_name and fsbn_match(fsbn_subnet_name.lower(), fsbn_pattern):
             fsbn_filtered_subnets.append(fsbn_subnet)  # Add matching subnet to the results
     return fsbn_filtered_subnets
 